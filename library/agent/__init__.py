@@ -1,6 +1,11 @@
 """Initializes the agent package, importing various agent types."""
 
+from .random_stream import RandomStream
 from .agent import Agent
 from .human_agent import HumanAgent
+from .matchbox_store import BoundedMatchboxStore, EvictionPolicy
 from .matchbox_agent import MatchboxAgent
 from .random_agent import RandomAgent
+from .async_agent import AsyncAgent, AsyncAgentAdapter
+from .remote_agent import RemoteAgent
+from .agent_server import AgentServer
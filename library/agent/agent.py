@@ -1,7 +1,13 @@
 """Agent module."""
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Optional
 
-from library.model import GameSymbol, TicTacToe
+import numpy as np
+
+from library.agent.random_stream import RandomStream
+from library.model import GameResult, GameStatus, GameSymbol, TicTacToe
+from library.model.shared_board_batch import CELL_SYMBOLS
 
 
 class Agent(ABC):
@@ -11,18 +17,56 @@ class Agent(ABC):
     updating the strategy based on the game's outcome.
     """
 
-    def __init__(self, symbol: GameSymbol) -> None:
+    def __init__(self, symbol: GameSymbol, random_stream: Optional[RandomStream] = None) -> None:
         self._symbol = symbol
+        self._random_stream = random_stream or RandomStream()
 
     @abstractmethod
     def get_move(self, game: TicTacToe) -> int:
         """Returns the next move from the Agent."""
 
+    def get_moves(self, games: Sequence[TicTacToe]) -> list[int]:
+        """Returns the next move from the Agent for each of the games.
+
+        Agents that can decide for many boards at once override this to avoid one call per board.
+        """
+        return [self.get_move(game) for game in games]
+
+    def get_board_moves(self, boards: np.ndarray) -> np.ndarray:
+        """Returns the next move from the Agent for each of a stack of in-progress boards in cell codes.
+
+        Works directly on the int8 boards of a SharedBoardBatch. Agents that can decide from cell codes override this to
+        avoid building a TicTacToe per board.
+        """
+        board_size = boards.shape[-1]
+        games = [TicTacToe(board_size, CELL_SYMBOLS[board], GameStatus.IN_PROGRESS, GameResult.INVALID) for board in boards]
+        return np.array(self.get_moves(games), dtype=np.intp)
+
     @abstractmethod
     def update_strategy(self, winner: GameSymbol) -> None:
         """Update the Agent's strategy based on the game outcome."""
 
+    def update_strategy_from_moves(self, _moves: Sequence[tuple[TicTacToe, int]], winner: GameSymbol) -> None:
+        """Update the Agent's strategy based on the outcome of a game whose moves it chose with `get_moves`.
+
+        Agents only record the moves of `get_move` calls, so a caller that batches the moves of several games, like an
+        AgentServer, keeps each game's positions and moves itself. Agents that learn from their moves override this.
+        The default is for agents whose strategy does not depend on their own moves: it ignores the moves and just
+        calls `update_strategy`.
+        """
+        self.update_strategy(winner)
+
     @property
     def symbol(self) -> GameSymbol:
         """Get the Agent's symbol."""
         return self._symbol
+
+    @property
+    def random_stream(self) -> RandomStream:
+        """Get the Agent's source of random numbers."""
+        return self._random_stream
+
+    @random_stream.setter
+    def random_stream(self, random_stream: RandomStream) -> None:
+        """Set the Agent's source of random numbers, e.g. an independent stream for a copy in a worker process."""
+        self._random_stream = random_stream
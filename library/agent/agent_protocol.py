@@ -0,0 +1,61 @@
+"""Agent protocol module.
+
+Messages are JSON objects, one per line. Every request carries an `id` that is echoed in its response, so a client may
+send many requests before reading any responses.
+
+Requests:
+    {"id": 1, "op": "symbol"}                       -> {"id": 1, "symbol": "O"}
+    {"id": 2, "op": "move", "board": "X   O    "}   -> {"id": 2, "move": 8}
+    {"id": 3, "op": "update", "winner": "X"}        -> {"id": 3}
+
+Failed requests are answered with {"id": ..., "error": "..."}.
+"""
+import json
+import math
+
+import numpy as np
+
+from library.model import GameResult, GameStatus, GameSymbol, TicTacToe
+
+
+class AgentProtocolError(Exception):
+    """Exception raised for failed or malformed agent protocol messages."""
+
+
+def encode_message(message: dict) -> bytes:
+    """Returns the wire representation of a message."""
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+def decode_message(line: bytes) -> dict:
+    """Returns the message encoded in a line received from the wire."""
+    try:
+        message = json.loads(line)
+    except ValueError as error:
+        raise AgentProtocolError(f"Malformed message: {line!r}") from error
+    if not isinstance(message, dict):
+        raise AgentProtocolError(f"Message is not an object: {line!r}")
+    return message
+
+
+def encode_board(game: TicTacToe) -> str:
+    """Returns the board of a game as a string of its cells in row-major order."""
+    return "".join(str(cell) for cell in game.board.ravel())
+
+
+def decode_board(board: str) -> TicTacToe:
+    """Returns an in-progress game with the board encoded by `encode_board`."""
+    if not isinstance(board, str):
+        raise AgentProtocolError(f"Board is not a string: {board!r}")
+    board_size = math.isqrt(len(board))
+    if board_size**2 != len(board):
+        raise AgentProtocolError(f"Board is not square: {board!r}")
+
+    try:
+        cells = [GameSymbol(cell) for cell in board]
+    except ValueError as error:
+        raise AgentProtocolError(f"Invalid board: {board!r}") from error
+    if GameSymbol.NONE not in cells:
+        raise AgentProtocolError(f"Board has no empty cell: {board!r}")
+    starting_board = np.array(cells, dtype=object).reshape(board_size, board_size)
+    return TicTacToe(board_size, starting_board, GameStatus.IN_PROGRESS, GameResult.INVALID)
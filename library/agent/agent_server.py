@@ -0,0 +1,173 @@
+"""Agent server module."""
+import queue
+import socket
+import socketserver
+import threading
+from typing import Optional, Union
+
+from library.agent import Agent
+from library.agent.agent_protocol import AgentProtocolError, decode_board, decode_message, encode_message
+from library.model import GameSymbol, TicTacToe
+
+
+class AgentServer:
+    """Hosts an Agent in its own process and serves moves to RemoteAgents over local TCP connections.
+
+    Every connection is read by its own thread, but all requests are handled by a single dispatcher thread, so the
+    hosted agent is never called concurrently. The dispatcher takes every request that has arrived, across all
+    connections, and answers each consecutive run of move requests with a single `get_moves` call.
+
+    Since batched moves are not recorded by the agent, the server keeps the moves it answered on every connection itself.
+    An `update` request trains the agent with `update_strategy_from_moves` on the moves of that connection since its
+    previous update, so every connection is one game at a time, however its requests happen to be batched.
+
+    Requests that are malformed or make the hosted agent raise are answered with an error, and the server keeps serving.
+
+    Attributes:
+        agent: The hosted agent.
+        max_batch_size: Maximum number of requests handled in one batch.
+    """
+
+    def __init__(self, agent: Agent, host: str = "127.0.0.1", port: int = 0, max_batch_size: int = 1024) -> None:
+        """Initialize an AgentServer listening on the given address (port 0 picks a free port)."""
+        self.agent = agent
+        self.max_batch_size = max_batch_size
+        # Requests of the connections, their read errors, and None for closed connections, all answered by the dispatcher
+        self._requests: queue.Queue[Optional[tuple[socket.socket, Union[dict, AgentProtocolError, None]]]] = queue.Queue()
+        # Moves answered on each connection since its last update, only used by the dispatcher thread
+        self._games: dict[socket.socket, list[tuple[TicTacToe, int]]] = {}
+        self._server = _AgentTCPServer((host, port), _AgentRequestHandler, self._requests)
+        self._threads: list[threading.Thread] = []
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Returns the host and port the server listens on."""
+        return self._server.server_address[:2]
+
+    def start(self) -> None:
+        """Start serving on background threads."""
+        self._threads = [
+            threading.Thread(target=self._server.serve_forever, daemon=True),
+            threading.Thread(target=self._dispatch, daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def serve_forever(self) -> None:
+        """Serve until the process is stopped."""
+        self.start()
+        for thread in self._threads:
+            thread.join()
+
+    def shutdown(self) -> None:
+        """Stop serving and close the listening socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._requests.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def _dispatch(self) -> None:
+        """Handle requests in batches until shut down."""
+        while (request := self._requests.get()) is not None:
+            batch = [request]
+            while len(batch) < self.max_batch_size:
+                try:
+                    request = self._requests.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    self._requests.put(None)
+                    break
+                batch.append(request)
+
+            moves: list[tuple[socket.socket, dict]] = []
+            for connection, message in batch:
+                if isinstance(message, dict) and message.get("op") == "move":
+                    moves.append((connection, message))
+                    continue
+                self._handle_moves(moves)
+                moves = []
+                if message is None:
+                    # The connection was closed, its unfinished game is dropped
+                    self._games.pop(connection, None)
+                elif isinstance(message, AgentProtocolError):
+                    self._respond(connection, {"id": None, "error": str(message)})
+                else:
+                    self._respond(connection, self._handle(connection, message))
+            self._handle_moves(moves)
+
+    def _handle_moves(self, requests: list[tuple[socket.socket, dict]]) -> None:
+        """Answer a run of move requests with a single call to the agent."""
+        if not requests:
+            return
+
+        try:
+            games = [decode_board(message["board"]) for _, message in requests]
+            moves = [int(move) for move in self.agent.get_moves(games)]
+        except Exception:  # pylint: disable=broad-exception-caught  # the hosted agent may raise anything
+            # Fall back to one call per request so only the failing ones are answered with an error
+            for connection, message in requests:
+                self._respond(connection, self._handle(connection, message))
+            return
+
+        for (connection, message), game, move in zip(requests, games, moves):
+            self._games.setdefault(connection, []).append((game, move))
+            self._respond(connection, {"id": message["id"], "move": move})
+
+    def _handle(self, connection: socket.socket, message: dict) -> dict:
+        """Returns the response to a single request of a connection."""
+        try:
+            if message.get("op") == "symbol":
+                return {"id": message["id"], "symbol": self.agent.symbol.value}
+            if message.get("op") == "move":
+                game = decode_board(message["board"])
+                (move,) = self.agent.get_moves([game])
+                self._games.setdefault(connection, []).append((game, int(move)))
+                return {"id": message["id"], "move": int(move)}
+            if message.get("op") == "update":
+                winner = GameSymbol(message["winner"])
+                self.agent.update_strategy_from_moves(self._games.pop(connection, []), winner)
+                return {"id": message["id"]}
+            raise AgentProtocolError(f"Unknown operation: {message.get('op')!r}")
+        except Exception as error:  # pylint: disable=broad-exception-caught  # the hosted agent may raise anything
+            # Malformed requests and errors of the hosted agent fail the request, never the dispatcher
+            return {"id": message["id"], "error": f"{type(error).__name__}: {error}"}
+
+    @staticmethod
+    def _respond(connection: socket.socket, response: dict) -> None:
+        """Send a response, ignoring clients that have disconnected."""
+        try:
+            connection.sendall(encode_message(response))
+        except OSError:
+            pass
+
+
+class _AgentTCPServer(socketserver.ThreadingTCPServer):
+    """TCP server that hands every request it reads to the dispatcher queue."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address: tuple[str, int], handler: type, requests: queue.Queue) -> None:
+        super().__init__(address, handler)
+        self.requests = requests
+
+
+class _AgentRequestHandler(socketserver.StreamRequestHandler):
+    """Reads the requests of one connection."""
+
+    def handle(self) -> None:
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        for line in self.rfile:
+            try:
+                message = decode_message(line)
+                if "id" not in message:
+                    raise AgentProtocolError(f"Message without id: {line!r}")
+            except AgentProtocolError as error:
+                # Only the dispatcher writes to the connection, so responses are never interleaved
+                self.server.requests.put((self.request, error))
+                continue
+            self.server.requests.put((self.request, message))
+        # Tell the dispatcher the connection is done
+        self.server.requests.put((self.request, None))
@@ -0,0 +1,68 @@
+"""Async agent module."""
+import asyncio
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from library.agent import Agent
+from library.model import GameSymbol, TicTacToe
+
+
+class AsyncAgent(ABC):
+    """Abstract base class for an Agent that can wait for its moves without blocking other games.
+
+    Serves as the asyncio counterpart of `Agent`, for running many games concurrently on one event loop.
+    """
+
+    def __init__(self, symbol: GameSymbol) -> None:
+        self._symbol = symbol
+
+    @abstractmethod
+    async def get_move(self, game: TicTacToe) -> int:
+        """Returns the next move from the Agent."""
+
+    @abstractmethod
+    async def update_strategy(self, winner: GameSymbol) -> None:
+        """Update the Agent's strategy based on the game outcome."""
+
+    @property
+    def symbol(self) -> GameSymbol:
+        """Get the Agent's symbol."""
+        return self._symbol
+
+
+class AsyncAgentAdapter(AsyncAgent):
+    """Runs a synchronous Agent behind the AsyncAgent interface, for one game at a time.
+
+    The adapter keeps the positions and moves of its current game itself and trains the wrapped Agent on them with
+    `update_strategy_from_moves`, so one learning agent can play many concurrent games, each through its own adapter,
+    without mixing up their moves.
+
+    Fast agents are called directly on the event loop. Agents that block, such as a HumanAgent waiting for input or a
+    RemoteAgent waiting for its server, should be marked as blocking so they are called on a worker thread instead.
+    """
+
+    def __init__(self, agent: Agent, blocking: bool = False) -> None:
+        super().__init__(agent.symbol)
+        self.agent = agent
+        self.blocking = blocking
+        self._moves: list[tuple[TicTacToe, int]] = []
+
+    async def get_move(self, game: TicTacToe) -> int:
+        """Returns the next move from the wrapped Agent."""
+        # The game keeps changing after the move, so the position is copied
+        position = TicTacToe(game.rows, np.copy(game.board), game.state, game.result)
+        if self.blocking:
+            (move,) = await asyncio.to_thread(self.agent.get_moves, [position])
+        else:
+            (move,) = self.agent.get_moves([position])
+        self._moves.append((position, int(move)))
+        return int(move)
+
+    async def update_strategy(self, winner: GameSymbol) -> None:
+        """Update the wrapped Agent's strategy based on the outcome of the game and the moves made in it."""
+        moves, self._moves = self._moves, []
+        if self.blocking:
+            await asyncio.to_thread(self.agent.update_strategy_from_moves, moves, winner)
+        else:
+            self.agent.update_strategy_from_moves(moves, winner)
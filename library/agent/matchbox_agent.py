@@ -1,13 +1,20 @@
 """Matchbox agent module."""
 from __future__ import annotations
 
-from matchbox import Bead, Engine, LearningConfig
+import math
+from collections.abc import Sequence
+from typing import Optional
 
-from library.agent import Agent
+import numpy as np
+from matchbox import Bead, Engine, LearningConfig, Matchbox
+
+from library.agent import Agent, RandomStream
+from library.agent.matchbox_store import BoundedMatchboxStore, EvictionPolicy
 from library.model import GameSymbol, TicTacToe
+from library.model.shared_board_batch import CELL_CHARACTERS
 
 
-# Colors for the 9 board positions
+# Colors for the 9 board positions, repeated on larger boards
 POSITION_COLORS = [
     "red",
     "blue",
@@ -21,12 +28,33 @@ POSITION_COLORS = [
 ]
 
 
+# Swaps the symbols in a state key, so that O sees its own pieces as X
+SWAP_SYMBOLS = str.maketrans({GameSymbol.X.value: GameSymbol.O.value, GameSymbol.O.value: GameSymbol.X.value})
+
+
 class MatchboxAgent(Agent):
-    """Matchbox learning agent."""
+    """Matchbox learning agent.
 
-    def __init__(self, symbol: GameSymbol, engine: Engine) -> None:
-        super().__init__(symbol)
+    Each agent keeps the moves of its current game itself, so agents for X and O can share one engine. With
+    normalized states, boards are stored from the perspective of the player to move and in a canonical orientation,
+    so all rotations and reflections of a position share one matchbox whose beads stand for cells of that orientation.
+    """
+
+    def __init__(
+        self,
+        symbol: GameSymbol,
+        engine: Engine,
+        random_stream: Optional[RandomStream] = None,
+        normalize_states: bool = False,
+    ) -> None:
+        super().__init__(symbol, random_stream)
         self._engine = engine
+        self._normalize_states = normalize_states
+        self._history: list[tuple[str, Bead]] = []
+        self._symmetries = _board_symmetries(math.isqrt(len(engine.available_beads)))
+        self._beads = {bead.action: bead for bead in engine.available_beads}
+        # Matchboxes keep their beads in the engine's order; these columns put the counts in cell order
+        self._cell_columns = np.argsort([bead.action for bead in engine.available_beads])
 
     @staticmethod
     def from_board_size(
@@ -34,6 +62,12 @@ class MatchboxAgent(Agent):
         board_size: int = 3,
         start_beads: int = 10,
         max_beads: int = 20,
+        win_reward: int = 1,
+        draw_reward: int = 0,
+        lose_punishment: int = 2,
+        max_boxes: Optional[int] = None,
+        eviction_policy: EvictionPolicy = EvictionPolicy.LRU,
+        random_stream: Optional[RandomStream] = None,
     ) -> MatchboxAgent:
         """Create a MatchboxAgent for the given board size.
 
@@ -42,21 +76,85 @@ class MatchboxAgent(Agent):
             board_size: Size of the board (default 3 for 3x3).
             start_beads: Initial beads per action.
             max_beads: Maximum beads per action.
+            win_reward: Beads added for every move of a won game.
+            draw_reward: Beads added (or removed, if negative) for every move of a tied game.
+            lose_punishment: Beads removed for every move of a lost game.
+            max_boxes: Maximum number of matchboxes to keep, or None for no limit.
+            eviction_policy: Policy for evicting matchboxes once max_boxes is reached.
+            random_stream: Source of random numbers for drawing beads (default: a freshly seeded stream).
 
         Returns:
             A new MatchboxAgent instance.
         """
-        num_cells = board_size**2
-        beads = [Bead(f"Cell{i}", i, POSITION_COLORS[i]) for i in range(num_cells)]
         config = LearningConfig(
             initial_beads=start_beads,
             max_beads=max_beads,
-            win_reward=1,
-            draw_reward=0,
-            lose_punishment=2,
+            win_reward=win_reward,
+            draw_reward=draw_reward,
+            lose_punishment=lose_punishment,
         )
+        engine = MatchboxAgent._create_engine(board_size, config, max_boxes, eviction_policy)
+        return MatchboxAgent(symbol, engine, random_stream)
+
+    @staticmethod
+    def self_play_pair(
+        board_size: int = 3,
+        start_beads: int = 10,
+        max_beads: int = 20,
+        win_reward: int = 1,
+        draw_reward: int = 0,
+        lose_punishment: int = 2,
+        max_boxes: Optional[int] = None,
+        eviction_policy: EvictionPolicy = EvictionPolicy.LRU,
+        random_stream: Optional[RandomStream] = None,
+    ) -> dict[GameSymbol, MatchboxAgent]:
+        """Create MatchboxAgents for X and O that learn from every game into one shared engine.
+
+        Both agents see the board from the perspective of the player to move and in a canonical orientation, so all
+        rotations and reflections of a position share one matchbox. The engine's storage is shared, but the two sides
+        never train the same matchboxes: X always moves with as many pieces of its own as of the opponent's on the board
+        and O with one fewer, so their positions stay distinct even from the mover's perspective.
+
+        Args:
+            board_size: Size of the board (default 3 for 3x3).
+            start_beads: Initial beads per action.
+            max_beads: Maximum beads per action.
+            win_reward: Beads added for every move of a won game.
+            draw_reward: Beads added (or removed, if negative) for every move of a tied game.
+            lose_punishment: Beads removed for every move of a lost game.
+            max_boxes: Maximum number of matchboxes to keep, or None for no limit.
+            eviction_policy: Policy for evicting matchboxes once max_boxes is reached.
+            random_stream: Stream the agents' own random streams are spawned from (default: a freshly seeded stream).
+
+        Returns:
+            The agents for X and O, keyed by symbol.
+        """
+        config = LearningConfig(
+            initial_beads=start_beads,
+            max_beads=max_beads,
+            win_reward=win_reward,
+            draw_reward=draw_reward,
+            lose_punishment=lose_punishment,
+        )
+        engine = MatchboxAgent._create_engine(board_size, config, max_boxes, eviction_policy)
+        x_stream, o_stream = (random_stream or RandomStream()).spawn(2)
+        return {
+            GameSymbol.X: MatchboxAgent(GameSymbol.X, engine, x_stream, normalize_states=True),
+            GameSymbol.O: MatchboxAgent(GameSymbol.O, engine, o_stream, normalize_states=True),
+        }
+
+    @staticmethod
+    def _create_engine(board_size: int, config: LearningConfig, max_boxes: Optional[int], eviction_policy: EvictionPolicy) -> Engine:
+        """Create a matchbox-rl Engine with one bead per cell of the board."""
+        num_cells = board_size**2
+        if max_boxes is not None and max_boxes < num_cells:
+            raise ValueError(f"max_boxes must hold at least the {num_cells} boxes of a single game, got {max_boxes}.")
+
+        beads = [Bead(f"Cell{i}", i, POSITION_COLORS[i % len(POSITION_COLORS)]) for i in range(num_cells)]
         engine = Engine(beads=beads, config=config)
-        return MatchboxAgent(symbol, engine)
+        if max_boxes is not None:
+            engine.boxes = BoundedMatchboxStore(max_boxes, eviction_policy)
+        return engine
 
     def get_move(self, game: TicTacToe) -> int:
         """Return the next move from the Agent.
@@ -67,25 +165,72 @@ class MatchboxAgent(Agent):
         Returns:
             The cell index (0-8) to place the symbol.
         """
-        import random
-
-        state_key = self._board_to_string(game.board)
-        empty_cells = game.empty_cells()
-
-        while True:
-            try:
-                action = self._engine.get_move(state_key)
-            except RuntimeError:
-                # Matchbox is empty - pick randomly from valid moves
-                return random.choice(empty_cells)
-
-            if action in empty_cells:
-                return action
-            # Remove all beads for this invalid position
-            bead = next(b for b in self._engine.available_beads if b.action == action)
-            current = self._engine.boxes[state_key].beads[bead]
-            self._engine.boxes[state_key].update(bead, -current, self._engine.config.max_beads)
-            self._engine.history.pop()
+        state_key, cells = self.normalize_state(self._board_to_string(game.board))
+        box = self._get_box(state_key)
+
+        # Draw only among the beads of empty cells
+        empty_cells = [cell for cell, symbol in enumerate(state_key) if symbol == GameSymbol.NONE.value]
+        beads = [self._beads[cell] for cell in empty_cells]
+        counts = [box.beads[bead] for bead in beads]
+        if sum(counts) == 0:
+            # Matchbox is empty - pick randomly from valid moves
+            return cells[empty_cells[self._random_stream.index(len(empty_cells))]]
+
+        bead = beads[self._random_stream.weighted_index(counts)]
+        self._history.append((state_key, bead))
+        return cells[bead.action]
+
+    def get_moves(self, games: Sequence[TicTacToe]) -> list[int]:
+        """Return the next move from the Agent for each of the games, drawn for all boards at once.
+
+        The moves are not recorded for training, since the Agent keeps the moves of a single game. Use get_move for
+        games the Agent should learn from.
+
+        Args:
+            games: The current game states.
+
+        Returns:
+            The cell index to place the symbol in for each game.
+        """
+        if not games:
+            return []
+        return self._draw_moves([self._board_to_string(game.board) for game in games])
+
+    def get_board_moves(self, boards: np.ndarray) -> np.ndarray:
+        """Return the next move from the Agent for each of a stack of boards in cell codes, without recording them.
+
+        Args:
+            boards: The boards, as in a SharedBoardBatch.
+
+        Returns:
+            The cell index to place the symbol in for each board.
+
+        Raises:
+            ValueError: If the boards are not of the size the Agent was created for.
+        """
+        if len(boards) == 0:
+            return np.zeros(0, dtype=np.intp)
+
+        num_cells = boards[0].size
+        keys = CELL_CHARACTERS[boards.reshape(len(boards), -1)].tobytes().decode()
+        return np.array(self._draw_moves([keys[start : start + num_cells] for start in range(0, len(keys), num_cells)]), dtype=np.intp)
+
+    def _draw_moves(self, state_keys: list[str]) -> list[int]:
+        """Draw a move for each of the state keys at once."""
+        if len(state_keys[0]) != len(self._beads):
+            raise ValueError(f"Boards of {len(state_keys[0])} cells given to an agent for boards of {len(self._beads)} cells.")
+        state_keys, cells = zip(*(self.normalize_state(state_key) for state_key in state_keys))
+        boxes = [self._get_box(state_key) for state_key in state_keys]
+        counts = np.array([list(box.beads.values()) for box in boxes])[:, self._cell_columns]
+        keys = np.frombuffer("".join(state_keys).encode(), dtype=np.uint8).reshape(len(state_keys), -1)
+        empty_cells = keys == ord(GameSymbol.NONE.value)
+
+        weights = counts * empty_cells
+        # Matchboxes without beads for any empty cell pick randomly from valid moves
+        empty_boxes = weights.sum(axis=1) == 0
+        weights[empty_boxes] = empty_cells[empty_boxes]
+        choices = self._random_stream.weighted_indices(weights)
+        return np.array(cells)[np.arange(len(state_keys)), choices].tolist()
 
     def update_strategy(self, winner: GameSymbol) -> None:
         """Update the Agent's strategy based on the game outcome.
@@ -93,6 +238,15 @@ class MatchboxAgent(Agent):
         Args:
             winner: The winning symbol, or NONE for a tie.
         """
+        history = self._history
+        if isinstance(self._engine.boxes, BoundedMatchboxStore):
+            # Skip moves whose matchbox was evicted during the game
+            history = [(state_id, bead) for state_id, bead in history if self._engine.boxes.get(state_id) is not None]
+
+        # The engine trains on its history, which only ever holds this agent's moves while training
+        self._engine.history = history
+        self._history = []
+
         if self._symbol == winner:
             self._engine.train("win")
         elif self._symbol.other() == winner:
@@ -100,6 +254,33 @@ class MatchboxAgent(Agent):
         else:
             self._engine.train("draw")
 
+    def update_strategy_from_moves(self, moves: Sequence[tuple[TicTacToe, int]], winner: GameSymbol) -> None:
+        """Update the Agent's strategy based on the outcome of a game whose moves it chose with `get_moves`.
+
+        The given moves replace any moves recorded by `get_move` since the last update.
+
+        Args:
+            moves: The position before each of the Agent's moves, and the cell it played.
+            winner: The winning symbol, or NONE for a tie.
+        """
+        self._history = []
+        for game, move in moves:
+            state_key, cells = self.normalize_state(self._board_to_string(game.board))
+            box = self._get_box(state_key)
+            # Like get_move, moves drawn at random from a matchbox without beads for any empty cell are not learned
+            empty_cells = [cell for cell, symbol in enumerate(state_key) if symbol == GameSymbol.NONE.value]
+            if sum(box.beads[self._beads[cell]] for cell in empty_cells) > 0:
+                self._history.append((state_key, self._beads[cells.index(move)]))
+        self.update_strategy(winner)
+
+    def _get_box(self, state_key: str) -> Matchbox:
+        """Return the matchbox for a state, creating it with the initial beads if it is new."""
+        boxes = self._engine.boxes
+        if state_key not in boxes:
+            loadout = {bead: self._engine.config.initial_beads for bead in self._engine.available_beads}
+            boxes[state_key] = Matchbox(state_key, loadout)
+        return boxes[state_key]
+
     def _board_to_string(self, board) -> str:
         """Convert board to string state key.
 
@@ -111,7 +292,67 @@ class MatchboxAgent(Agent):
         """
         return "".join(str(cell) for row in board for cell in row)
 
+    def normalize_state(self, state_key: str) -> tuple[str, tuple[int, ...]]:
+        """Convert a state key to the key this agent stores it under.
+
+        Args:
+            state_key: String representation of a board like "X O      ", as seen by X.
+
+        Returns:
+            The key of the matchbox for the state, and for each bead of that matchbox the board cell it stands for. Unless
+            this agent normalizes states, these are the key itself and the identity.
+        """
+        if not self._normalize_states:
+            return state_key, self._symmetries[0]
+
+        if self._symbol == GameSymbol.O:
+            state_key = state_key.translate(SWAP_SYMBOLS)
+        return min(("".join(state_key[cell] for cell in cells), cells) for cells in self._symmetries)
+
+    def bead_table(self) -> dict[str, tuple[int, ...]]:
+        """Returns the bead counts of every matchbox, in the order of the engine's beads, keyed by state."""
+        return {state_id: tuple(self._engine.boxes[state_id].beads.values()) for state_id in self._engine.boxes}
+
+    def load_bead_table(self, table: dict[str, tuple[int, ...]]) -> None:
+        """Replace all matchboxes with the bead counts of a table returned by `bead_table`."""
+        self._engine.boxes.clear()
+        self.update_bead_table(table)
+
+    def update_bead_table(self, table: dict[str, tuple[int, ...]]) -> None:
+        """Set the bead counts of the matchboxes in a table like the one returned by `bead_table`, keeping all others."""
+        for state_id, counts in table.items():
+            self._engine.boxes[state_id] = Matchbox(state_id, dict(zip(self._engine.available_beads, counts)))
+
+    def empty_copy(self, random_stream: Optional[RandomStream] = None) -> MatchboxAgent:
+        """Returns an agent with the same symbol, learning config and matchbox store settings, but without matchboxes."""
+        boxes = self._engine.boxes
+        bounded = isinstance(boxes, BoundedMatchboxStore)
+        engine = MatchboxAgent._create_engine(
+            math.isqrt(len(self._engine.available_beads)),
+            self._engine.config,
+            boxes.capacity if bounded else None,
+            boxes.policy if bounded else EvictionPolicy.LRU,
+        )
+        if bounded:
+            engine.boxes.sample_size = boxes.sample_size
+        return MatchboxAgent(self._symbol, engine, random_stream, self._normalize_states)
+
+    @property
+    def normalize_states(self) -> bool:
+        """Whether the agent stores states from its own perspective and up to symmetry."""
+        return self._normalize_states
+
     @property
     def engine(self) -> Engine:
         """Access the underlying matchbox-rl Engine."""
         return self._engine
+
+
+def _board_symmetries(board_size: int) -> list[tuple[int, ...]]:
+    """Returns the rotations and reflections of a square board, starting with the identity.
+
+    Each symmetry lists, for every cell of the transformed board, the cell of the original board it shows.
+    """
+    cells = np.arange(board_size**2).reshape(board_size, board_size)
+    transforms = [np.rot90(grid, turns) for grid in [cells, np.fliplr(cells)] for turns in range(4)]
+    return list(dict.fromkeys(tuple(transform.ravel().tolist()) for transform in transforms))
@@ -0,0 +1,101 @@
+"""Matchbox store module."""
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
+from enum import Enum
+
+from matchbox import Matchbox
+
+
+class EvictionPolicy(Enum):
+    """Policy for choosing which matchbox to evict from a full store."""
+
+    LRU = "lru"
+    VISITS = "visits"
+
+
+class BoundedMatchboxStore(MutableMapping):
+    """Capacity-bounded replacement for the dictionary of matchboxes held by a matchbox-rl Engine.
+
+    The engine checks `state_id in boxes` before every move, so membership tests are counted as lookups: a hit marks the
+    box as recently used and visited, a miss is followed by the engine inserting a new box. Inserting into a full store
+    evicts the least recently used box, or with the VISITS policy the least visited of the `sample_size` least
+    recently used boxes.
+
+    Attributes:
+        capacity: Maximum number of matchboxes held by the store.
+        policy: The eviction policy.
+        sample_size: Number of least recently used boxes considered by the VISITS policy.
+        hits: Number of lookups that found a matchbox.
+        misses: Number of lookups that did not find a matchbox.
+        evictions: Number of matchboxes evicted.
+    """
+
+    def __init__(self, capacity: int, policy: EvictionPolicy = EvictionPolicy.LRU, sample_size: int = 16) -> None:
+        """Initialize an empty BoundedMatchboxStore."""
+        if capacity < 1:
+            raise ValueError(f"Capacity must be positive, got {capacity}.")
+
+        self.capacity = capacity
+        self.policy = policy
+        self.sample_size = sample_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._boxes: OrderedDict[str, Matchbox] = OrderedDict()
+        self._visits: dict[str, int] = {}
+
+    def __contains__(self, state_id: object) -> bool:
+        if state_id not in self._boxes:
+            self.misses += 1
+            return False
+
+        self.hits += 1
+        self._visits[state_id] += 1
+        self._boxes.move_to_end(state_id)
+        return True
+
+    def __getitem__(self, state_id: str) -> Matchbox:
+        return self._boxes[state_id]
+
+    def __setitem__(self, state_id: str, box: Matchbox) -> None:
+        if state_id not in self._boxes:
+            if len(self._boxes) >= self.capacity:
+                self._evict()
+            self._visits[state_id] = 1
+        self._boxes[state_id] = box
+        self._boxes.move_to_end(state_id)
+
+    def __delitem__(self, state_id: str) -> None:
+        del self._boxes[state_id]
+        del self._visits[state_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._boxes)
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    @property
+    def hit_rate(self) -> float:
+        """Returns the fraction of lookups that found a matchbox."""
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+    def _evict(self) -> None:
+        """Evict one matchbox according to the eviction policy."""
+        if self.policy == EvictionPolicy.VISITS:
+            candidates = (state_id for state_id, _ in zip(self._boxes, range(self.sample_size)))
+            victim = min(candidates, key=self._visits.__getitem__)
+        else:
+            victim = next(iter(self._boxes))
+
+        del self[victim]
+        self.evictions += 1
+
+    def __repr__(self) -> str:
+        return (
+            f"BoundedMatchboxStore(boxes={len(self)}, capacity={self.capacity}, hits={self.hits}, "
+            f"misses={self.misses}, evictions={self.evictions})"
+        )
@@ -1,8 +1,11 @@
 """Random agent module."""
-import random
+from collections.abc import Sequence
+
+import numpy as np
 
 from library.agent import Agent
 from library.model import GameSymbol, TicTacToe
+from library.model.shared_board_batch import EMPTY
 
 
 class RandomAgent(Agent):
@@ -10,7 +13,19 @@ class RandomAgent(Agent):
 
     def get_move(self, game: TicTacToe) -> int:
         """Returns the next move from the Agent."""
-        return random.choice(game.empty_cells())
+        empty_cells = game.empty_cells()
+        return empty_cells[self._random_stream.index(len(empty_cells))]
+
+    def get_moves(self, games: Sequence[TicTacToe]) -> list[int]:
+        """Returns a random empty cell for each of the games, drawn for all boards at once."""
+        if not games:
+            return []
+        empty_cells = np.stack([game.board.ravel() for game in games]) == GameSymbol.NONE
+        return self._random_stream.weighted_indices(empty_cells).tolist()
+
+    def get_board_moves(self, boards: np.ndarray) -> np.ndarray:
+        """Returns a random empty cell for each of a stack of boards in cell codes."""
+        return self._random_stream.weighted_indices(boards.reshape(len(boards), -1) == EMPTY)
 
     def update_strategy(self, winner: GameSymbol) -> None:
         """Update the Agent's strategy based on the game outcome."""
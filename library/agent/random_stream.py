@@ -0,0 +1,62 @@
+"""Random stream module."""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Optional, Union
+
+import numpy as np
+
+
+class RandomStream:
+    """Seedable stream of uniform random numbers, drawn from a NumPy Generator a block at a time.
+
+    Streams created with `spawn` are statistically independent of each other and of their parent, so every agent or
+    worker process can own its own stream and a run is reproducible from a single seed.
+
+    Attributes:
+        generator: The NumPy Generator the numbers are drawn from.
+        block_size: Number of random numbers drawn from the generator at once.
+    """
+
+    def __init__(self, seed: Optional[Union[int, np.random.SeedSequence, np.random.Generator]] = None, block_size: int = 4096) -> None:
+        """Initialize a RandomStream from a seed, a SeedSequence or an existing Generator."""
+        self.generator = np.random.default_rng(seed)
+        self.block_size = block_size
+        self._block: list[float] = []
+        self._position = 0
+
+    def random(self) -> float:
+        """Returns a uniform random number in [0, 1)."""
+        if self._position == len(self._block):
+            self._block = self.generator.random(self.block_size).tolist()
+            self._position = 0
+
+        value = self._block[self._position]
+        self._position += 1
+        return value
+
+    def index(self, size: int) -> int:
+        """Returns a uniformly random index in [0, size)."""
+        return int(self.random() * size)
+
+    def weighted_index(self, weights: Sequence[int]) -> int:
+        """Returns a random index in [0, len(weights)), chosen with probability proportional to its weight."""
+        target = self.random() * sum(weights)
+        for index, weight in enumerate(weights):
+            target -= weight
+            if target < 0:
+                return index
+        return max(index for index, weight in enumerate(weights) if weight > 0)
+
+    def weighted_indices(self, weights: np.ndarray) -> np.ndarray:
+        """Returns one random column index per row of a 2D weight array, chosen with probability proportional to its weight.
+
+        Every row must have a positive total weight. A boolean mask picks uniformly among its True columns.
+        """
+        cumulative = np.cumsum(weights, axis=1)
+        targets = self.generator.random(len(cumulative)) * cumulative[:, -1]
+        return np.argmax(cumulative > targets[:, np.newaxis], axis=1)
+
+    def spawn(self, count: int) -> list[RandomStream]:
+        """Returns independent child streams, e.g. one per agent or worker process."""
+        return [RandomStream(generator, self.block_size) for generator in self.generator.spawn(count)]
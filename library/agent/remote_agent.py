@@ -0,0 +1,71 @@
+"""Remote agent module."""
+import socket
+from collections.abc import Sequence
+
+from library.agent import Agent
+from library.agent.agent_protocol import AgentProtocolError, decode_message, encode_board, encode_message
+from library.model import GameSymbol, TicTacToe
+
+
+class RemoteAgent(Agent):
+    """Agent whose moves are made by an agent hosted by an AgentServer, possibly in another process.
+
+    Batched move requests are pipelined: all of them are sent before the first response is read, and the server answers
+    them with a single call to its agent.
+    """
+
+    def __init__(self, symbol: GameSymbol, address: tuple[str, int], timeout: float = 30.0) -> None:
+        """Connect to the AgentServer at the given address.
+
+        Args:
+            symbol: The game symbol (X or O) for this agent, which must match the hosted agent's symbol.
+            address: The host and port of the AgentServer.
+            timeout: Seconds to wait for a response before giving up.
+        """
+        super().__init__(symbol)
+        self._socket = socket.create_connection(address, timeout)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._socket.makefile("rb")
+        self._next_id = 0
+
+        (response,) = self._request([{"op": "symbol"}])
+        if response["symbol"] != symbol.value:
+            self.close()
+            raise AgentProtocolError(f"Server hosts an agent for {response['symbol']}, not {symbol.value}.")
+
+    def get_move(self, game: TicTacToe) -> int:
+        """Returns the next move from the hosted Agent."""
+        return self.get_moves([game])[0]
+
+    def get_moves(self, games: Sequence[TicTacToe]) -> list[int]:
+        """Returns the next move from the hosted Agent for each of the games, using one pipelined round trip."""
+        responses = self._request([{"op": "move", "board": encode_board(game)} for game in games])
+        return [response["move"] for response in responses]
+
+    def update_strategy(self, winner: GameSymbol) -> None:
+        """Update the hosted Agent's strategy based on the game outcome."""
+        self._request([{"op": "update", "winner": winner.value}])
+
+    def close(self) -> None:
+        """Close the connection to the server."""
+        self._reader.close()
+        self._socket.close()
+
+    def _request(self, messages: list[dict]) -> list[dict]:
+        """Send the requests at once and return their responses in request order."""
+        first_id = self._next_id
+        self._next_id += len(messages)
+        self._socket.sendall(b"".join(encode_message({"id": first_id + i, **message}) for i, message in enumerate(messages)))
+
+        responses: list[dict] = [{}] * len(messages)
+        for _ in messages:
+            line = self._reader.readline()
+            if not line:
+                raise AgentProtocolError("Connection closed by the agent server.")
+            response = decode_message(line)
+            if "error" in response:
+                raise AgentProtocolError(response["error"])
+            if not isinstance(response.get("id"), int) or not 0 <= response["id"] - first_id < len(messages):
+                raise AgentProtocolError(f"Unexpected response: {response}")
+            responses[response["id"] - first_id] = response
+        return responses
@@ -2,4 +2,10 @@
 
 from .game_subscriber import GameSubscriber
 from .game_publisher import GamePublisher
+from .stopping_policy import StoppingPolicy
+from .game_record import GameRecord
 from .game_controller import GameController
+from .game_pipeline import chunked, filter_records, publish_records, tap
+from .async_game_server import AsyncGameServer
+from .async_game_client import AsyncGameClient, simulate_clients
+from .batch_simulation import simulate_batch
@@ -0,0 +1,134 @@
+"""Async game client module."""
+from __future__ import annotations
+
+import asyncio
+import itertools
+from collections.abc import Callable
+from typing import Optional
+
+from library.agent import RandomStream
+from library.agent.agent_protocol import AgentProtocolError, decode_message, encode_message
+from library.model import GameSymbol
+
+
+class AsyncGameClient:
+    """Client playing any number of concurrent games on an AsyncGameServer over one connection."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+        self._request_ids = itertools.count()
+        self._responses: dict[int, asyncio.Future] = {}
+        self._states: dict[int, asyncio.Queue] = {}
+        self._receiver = asyncio.create_task(self._receive())
+
+    @staticmethod
+    async def connect(address: tuple[str, int]) -> AsyncGameClient:
+        """Returns a client connected to the server at the given address."""
+        reader, writer = await asyncio.open_connection(*address)
+        return AsyncGameClient(reader, writer)
+
+    async def play_game(self, symbol: GameSymbol, opponent: str, choose_move: Callable[[str], int]) -> GameSymbol:
+        """Play a game against a server-side opponent.
+
+        Args:
+            symbol: The symbol (X or O) to play as.
+            opponent: Name of the server-side opponent.
+            choose_move: Returns the cell to play given the board string.
+
+        Returns:
+            The winning symbol, or NONE for a tie.
+
+        Raises:
+            AgentProtocolError: If the server cannot start or finish the game.
+        """
+        response = await self._request({"op": "new_game", "symbol": symbol.value, "opponent": opponent})
+        game_id = response["game"]
+        states = self._states.setdefault(game_id, asyncio.Queue())
+        try:
+            while True:
+                state = await states.get()
+                if "error" in state:
+                    raise AgentProtocolError(state["error"])
+                if state["state"] == "GAME_OVER":
+                    return GameSymbol(state["result"])
+                if state["turn"] == symbol.value:
+                    await self._request({"op": "move", "game": game_id, "cell": choose_move(state["board"])})
+        finally:
+            del self._states[game_id]
+
+    async def close(self) -> None:
+        """Close the connection to the server."""
+        self._receiver.cancel()
+        self._writer.close()
+        await self._writer.wait_closed()
+
+    async def _request(self, message: dict) -> dict:
+        """Send a request and wait for its response."""
+        request_id = next(self._request_ids)
+        response = asyncio.get_running_loop().create_future()
+        self._responses[request_id] = response
+        self._writer.write(encode_message({"id": request_id, **message}))
+        await self._writer.drain()
+
+        result = await response
+        if "error" in result:
+            raise AgentProtocolError(result["error"])
+        return result
+
+    async def _receive(self) -> None:
+        """Route every incoming message to the request or game waiting for it."""
+        while line := await self._reader.readline():
+            message = decode_message(line)
+            if "id" in message:
+                self._responses.pop(message["id"]).set_result(message)
+            else:
+                self._states.setdefault(message["game"], asyncio.Queue()).put_nowait(message)
+
+        for response in self._responses.values():
+            response.set_exception(AgentProtocolError("Connection closed by the game server."))
+
+
+async def simulate_clients(
+    address: tuple[str, int],
+    num_clients: int,
+    games_per_client: int,
+    concurrent_games: int = 1,
+    opponent: str = "random",
+    seed: Optional[int] = None,
+) -> dict[GameSymbol, int]:
+    """Load test an AsyncGameServer with simulated clients that make random moves.
+
+    Args:
+        address: The host and port of the server.
+        num_clients: Number of client connections.
+        games_per_client: Number of games each client plays.
+        concurrent_games: Number of games each client plays at the same time.
+        opponent: Name of the server-side opponent.
+        seed: Seed for the clients' moves.
+
+    Returns:
+        The number of games won by each symbol, with ties counted under NONE.
+    """
+    results = {GameSymbol.X: 0, GameSymbol.O: 0, GameSymbol.NONE: 0}
+    streams = RandomStream(seed).spawn(num_clients)
+
+    async def run_client(stream: RandomStream) -> None:
+        def choose_move(board: str) -> int:
+            empty_cells = [cell for cell, symbol in enumerate(board) if symbol == GameSymbol.NONE.value]
+            return empty_cells[stream.index(len(empty_cells))]
+
+        async def play_games(count: int, symbol: GameSymbol) -> None:
+            for _ in range(count):
+                results[await client.play_game(symbol, opponent, choose_move)] += 1
+
+        client = await AsyncGameClient.connect(address)
+        try:
+            counts = [games_per_client // concurrent_games + (i < games_per_client % concurrent_games) for i in range(concurrent_games)]
+            symbols = itertools.cycle([GameSymbol.X, GameSymbol.O])
+            await asyncio.gather(*(play_games(count, symbol) for count, symbol in zip(counts, symbols)))
+        finally:
+            await client.close()
+
+    await asyncio.gather(*(run_client(stream) for stream in streams))
+    return results
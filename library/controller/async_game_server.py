@@ -0,0 +1,223 @@
+"""Async game server module.
+
+Clients talk to the server over TCP with newline-delimited JSON messages, using the same framing as the agent
+protocol. Requests carry an `id` that is echoed in their response:
+
+    {"id": 1, "op": "new_game", "symbol": "X", "opponent": "random"}  -> {"id": 1, "game": 0}
+    {"id": 2, "op": "move", "game": 0, "cell": 4}                     -> {"id": 2}
+
+Failed requests are answered with {"id": ..., "error": "..."}. After every move, and once when a game starts, the server
+pushes the game state to the client:
+
+    {"game": 0, "board": "    X    ", "turn": "O", "state": "IN_PROGRESS", "result": null}
+
+If a game cannot be finished, e.g. because the server-side agent fails, the server pushes an error for it instead:
+
+    {"game": 0, "error": "..."}
+"""
+import asyncio
+import itertools
+from collections.abc import Callable
+from typing import Optional
+
+import numpy as np
+
+from library.agent.agent_protocol import AgentProtocolError, decode_message, encode_board, encode_message
+from library.agent.async_agent import AsyncAgent
+from library.controller import GamePublisher
+from library.model import GameStatus, GameSymbol, TicTacToe
+
+
+class AsyncGameServer:
+    """Hosts many concurrent games between connected clients and server-side agents on a single asyncio event loop.
+
+    Every game runs as its own task and only waits on the player whose turn it is, so a slow client or agent never holds
+    up other games. The server-side opponent of each game is created by the agent factory the client asks for.
+
+    Factories must create a new AsyncAgent for every game, since an AsyncAgent keeps the moves of the game it is playing.
+    To let all games train one learning agent, wrap it in a new AsyncAgentAdapter per game:
+
+        server = AsyncGameServer({"matchbox": lambda symbol: AsyncAgentAdapter(shared_agents[symbol])})
+
+    Games are published to the publisher, if any, one complete game at a time: the states of a game are collected while
+    it is played and published together once it is over, so subscribers see the same sequence of notifications as from
+    a GameController even though thousands of games are interleaved.
+
+    Attributes:
+        agent_factories: Factories creating the server-side opponent for a symbol, keyed by opponent name.
+        board_size: Size of the board the games are played on.
+        publisher: Optional publisher that finished games are published to.
+    """
+
+    def __init__(
+        self,
+        agent_factories: dict[str, Callable[[GameSymbol], AsyncAgent]],
+        board_size: int = 3,
+        publisher: Optional[GamePublisher] = None,
+    ) -> None:
+        """Initialize an AsyncGameServer."""
+        self.agent_factories = agent_factories
+        self.board_size = board_size
+        self.publisher = publisher
+        self._game_ids = itertools.count()
+        # Server-side opponents of the games in progress
+        self._opponents: set[AsyncAgent] = set()
+        self._server: Optional[asyncio.Server] = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0, backlog: int = 4096) -> None:
+        """Start listening for clients (port 0 picks a free port), queueing up to backlog pending connections."""
+        self._server = await asyncio.start_server(self._handle_client, host, port, backlog=backlog)
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Returns the host and port the server listens on."""
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self) -> None:
+        """Serve clients until cancelled."""
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop accepting clients."""
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve the requests of one client connection."""
+        connection = _ClientConnection(writer)
+        try:
+            while line := await reader.readline():
+                message: dict = {}
+                try:
+                    message = decode_message(line)
+                    response = self._handle_request(connection, message)
+                except (AgentProtocolError, KeyError, TypeError, ValueError) as error:
+                    response = {"id": message.get("id"), "error": str(error)}
+                connection.send(response)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for task in list(connection.tasks.values()):
+                task.cancel()
+            writer.close()
+
+    def _handle_request(self, connection: "_ClientConnection", message: dict) -> dict:
+        """Returns the response to a single request."""
+        if message.get("op") == "new_game":
+            symbol = GameSymbol(message["symbol"])
+            if symbol is GameSymbol.NONE:
+                raise AgentProtocolError("Clients play as X or O.")
+            opponent = self.agent_factories.get(message["opponent"])
+            if opponent is None:
+                raise AgentProtocolError(f"Unknown opponent: {message['opponent']!r}")
+
+            agent = opponent(symbol.other())
+            if agent in self._opponents:
+                raise AgentProtocolError(f"The {message['opponent']!r} factory returned an agent that is already playing a game.")
+
+            game_id = next(self._game_ids)
+            client = _ClientAgent(symbol)
+            players: dict[GameSymbol, AsyncAgent] = {symbol: client, symbol.other(): agent}
+            self._opponents.add(agent)
+            connection.clients[game_id] = client
+            connection.tasks[game_id] = asyncio.create_task(self._play_game(connection, game_id, players))
+            # Also runs for games cancelled before they started
+            connection.tasks[game_id].add_done_callback(lambda _: self._opponents.discard(agent))
+            return {"id": message["id"], "game": game_id}
+
+        if message.get("op") == "move":
+            client = connection.clients.get(message["game"])
+            if client is None:
+                raise AgentProtocolError(f"Unknown game: {message['game']!r}")
+            client.submit_move(int(message["cell"]))
+            return {"id": message["id"]}
+
+        raise AgentProtocolError(f"Unknown operation: {message.get('op')!r}")
+
+    async def _play_game(self, connection: "_ClientConnection", game_id: int, players: dict[GameSymbol, AsyncAgent]) -> None:
+        """Play one game to the end, pushing every state to the client."""
+        game = TicTacToe.from_board_size(self.board_size)
+        states: list[TicTacToe] = []
+        connection.send(_state_message(game_id, game))
+
+        try:
+            while game.state == GameStatus.IN_PROGRESS:
+                player = players[game.current_turn()]
+                move = await player.get_move(game)
+                game.place_symbol(move, player.symbol)
+                states.append(TicTacToe(self.board_size, np.copy(game.board), game.state, game.result))
+                if game.state == GameStatus.IN_PROGRESS:
+                    connection.send(_state_message(game_id, game))
+
+            for player in players.values():
+                await player.update_strategy(game.result.value)
+        except Exception as error:  # pylint: disable=broad-exception-caught  # agents may raise anything
+            # A failing agent ends its own game only, and the client is told instead of waiting forever
+            connection.send({"game": game_id, "error": f"{type(error).__name__}: {error}"})
+            return
+        finally:
+            connection.clients.pop(game_id, None)
+            connection.tasks.pop(game_id, None)
+
+        # The final state is pushed once the agents have learned from the game, so a failure can still be reported
+        connection.send(_state_message(game_id, game))
+        if self.publisher is not None:
+            for state in states:
+                self.publisher.publish(state)
+
+
+class _ClientConnection:
+    """Games and outgoing messages of one client connection."""
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self.writer = writer
+        self.clients: dict[int, _ClientAgent] = {}
+        self.tasks: dict[int, asyncio.Task] = {}
+
+    def send(self, message: dict) -> None:
+        """Queue a message for the client."""
+        if not self.writer.is_closing():
+            self.writer.write(encode_message(message))
+
+
+class _ClientAgent(AsyncAgent):
+    """Player whose moves are sent by a connected client."""
+
+    def __init__(self, symbol: GameSymbol) -> None:
+        super().__init__(symbol)
+        self._game: Optional[TicTacToe] = None
+        self._move: Optional[asyncio.Future] = None
+
+    async def get_move(self, game: TicTacToe) -> int:
+        """Wait for the client to send a valid move."""
+        self._game = game
+        self._move = asyncio.get_running_loop().create_future()
+        try:
+            return await self._move
+        finally:
+            self._game = None
+            self._move = None
+
+    async def update_strategy(self, winner: GameSymbol) -> None:
+        """Clients learn from the game states pushed to them."""
+
+    def submit_move(self, cell: int) -> None:
+        """Hand a move sent by the client to the waiting game."""
+        if self._move is None:
+            raise AgentProtocolError("It is not your turn.")
+        if cell not in self._game.empty_cells():
+            raise AgentProtocolError(f"Invalid move. Cell {cell} is not empty.")
+        self._move.set_result(cell)
+        self._move = None
+
+
+def _state_message(game_id: int, game: TicTacToe) -> dict:
+    """Returns the message pushing the state of a game to its client."""
+    return {
+        "game": game_id,
+        "board": encode_board(game),
+        "turn": game.current_turn().value,
+        "state": game.state.name,
+        "result": game.result.value.value if game.state == GameStatus.GAME_OVER else None,
+    }
@@ -0,0 +1,70 @@
+"""Batch simulation module."""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+from library.agent import Agent, RandomStream
+from library.model import GameSymbol, SharedBoardBatch
+from library.model.shared_board_batch import IN_PROGRESS, O_WIN, TIE, X_WIN
+
+
+def simulate_batch(
+    players: dict[GameSymbol, Agent],
+    num_games: int,
+    board_size: int = 3,
+    num_workers: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> dict[GameSymbol, int]:
+    """Play a batch of games on several worker processes that share the boards instead of sending them.
+
+    The boards live in a SharedBoardBatch. Every worker attaches to it and plays a disjoint slice of the games in place,
+    asking each player for the moves of all of its games at once with `get_board_moves`. The players are sent to every
+    worker once, each with its own random stream, and do not learn from the games.
+
+    Args:
+        players: The players, keyed by symbol.
+        num_games: Number of games to play.
+        board_size: Size of the boards.
+        num_workers: Number of worker processes (default: one per CPU).
+        seed: Seed for the workers' random streams.
+
+    Returns:
+        The number of games won by each symbol, with ties counted under NONE.
+    """
+    num_workers = min(num_workers or multiprocessing.cpu_count(), max(num_games, 1))
+    bounds = np.linspace(0, num_games, num_workers + 1).astype(int)
+    streams = RandomStream(seed).spawn(num_workers)
+
+    context = multiprocessing.get_context("spawn")
+    with SharedBoardBatch(num_games, board_size) as batch:
+        with ProcessPoolExecutor(num_workers, mp_context=context) as executor:
+            futures = [
+                executor.submit(_play_slice, batch, start, stop, players, stream) for start, stop, stream in zip(bounds[:-1], bounds[1:], streams)
+            ]
+            for future in futures:
+                future.result()
+
+        # The workers wrote the results into shared memory, so they are read in place
+        return {
+            GameSymbol.X: int(np.count_nonzero(batch.results == X_WIN)),
+            GameSymbol.O: int(np.count_nonzero(batch.results == O_WIN)),
+            GameSymbol.NONE: int(np.count_nonzero(batch.results == TIE)),
+        }
+
+
+def _play_slice(batch: SharedBoardBatch, start: int, stop: int, players: dict[GameSymbol, Agent], random_stream: RandomStream) -> None:
+    """Play the games in rows [start, stop) of the batch to the end."""
+    for player, stream in zip(players.values(), random_stream.spawn(len(players))):
+        player.random_stream = stream
+
+    rows = np.arange(start, stop)
+    try:
+        while len(rows := rows[batch.results[rows] == IN_PROGRESS]) > 0:
+            x_to_move = batch.move_counts[rows] % 2 == 0
+            for symbol, symbol_rows in [(GameSymbol.X, rows[x_to_move]), (GameSymbol.O, rows[~x_to_move])]:
+                if len(symbol_rows) > 0:
+                    batch.apply_moves(symbol_rows, players[symbol].get_board_moves(batch.boards[symbol_rows]))
+    finally:
+        batch.close()
@@ -1,8 +1,11 @@
 """Game controller module."""
+import itertools
 import time
+from collections.abc import Iterator
+from typing import Optional
 
 from library.agent import Agent
-from library.controller import GamePublisher
+from library.controller import GamePublisher, GameRecord, StoppingPolicy
 from library.model import GameStatus, GameSymbol, TicTacToe
 
 
@@ -13,32 +16,92 @@ class GameController:
         game: The game to play.
         players: The players in the game.
         publisher: The publisher for the game.
+        stopping_policy: Optional policy that can end a run of games early.
+        move_delay: Seconds to pause after every move, so the game can be followed on screen.
     """
 
-    def __init__(self, game: TicTacToe, players: dict[GameSymbol, Agent], publisher: GamePublisher) -> None:
+    def __init__(
+        self,
+        game: TicTacToe,
+        players: dict[GameSymbol, Agent],
+        publisher: GamePublisher,
+        stopping_policy: Optional[StoppingPolicy] = None,
+        move_delay: float = 0.001,
+    ) -> None:
         """Initialize the game controller."""
         self.game = game
         self.players = players
         self.publisher = publisher
+        self.stopping_policy = stopping_policy
+        self.move_delay = move_delay
 
-    def play_games(self, num_games: int) -> None:
-        """Play a number of games."""
-        for _ in range(num_games):
-            self.play_game()
+    def play_games(self, num_games: int) -> int:
+        """Play a number of games.
+
+        The stopping policy, if any, is consulted after every game and can end the run early.
+
+        Args:
+            num_games: The maximum number of games to play.
+
+        Returns:
+            The number of games actually played.
+        """
+        return sum(1 for _ in self.stream_games(num_games))
+
+    def stream_games(self, num_games: Optional[int] = None) -> Iterator[GameRecord]:
+        """Lazily play games, yielding a record of each one as soon as it is over.
+
+        Games are only played as the records are consumed, so stages such as filters, trackers or trainers can be chained
+        onto the stream as generators (see `library.controller.game_pipeline`) and run in constant memory. The players
+        have learned from a game before its record is yielded, and the stopping policy, if any, is consulted after the
+        consumer has handled it.
+
+        Args:
+            num_games: The maximum number of games to play, or None to play until the stopping policy ends the run.
+
+        Yields:
+            A record of every game played.
+        """
+        indexes = itertools.count() if num_games is None else range(num_games)
+        for index in indexes:
+            record = self.play_game(index)
+            self.update_strategies()
             self.reset()
+            yield record
+            if self.stopping_policy is not None and self.stopping_policy.should_stop():
+                return
 
-    def play_game(self) -> None:
-        """Play a game."""
+    def play_game(self, index: int = 0) -> GameRecord:
+        """Play a game.
+
+        Args:
+            index: Position of the game in the run, stored in its record.
+
+        Returns:
+            A record of the game.
+        """
+        moves = []
+        move_times = []
+        game_start = time.perf_counter()
         while self.game.state == GameStatus.IN_PROGRESS:
             player = self.players[self.game.current_turn()]
+            move_start = time.perf_counter()
             move = player.get_move(self.game)
+            move_times.append(time.perf_counter() - move_start)
             self.game.place_symbol(move, player.symbol)
+            moves.append(move)
             self.publisher.publish(self.game)
-            time.sleep(0.001)
+            if self.move_delay > 0:
+                time.sleep(self.move_delay)
 
-    def reset(self) -> None:
-        """Reset the game."""
+        duration = time.perf_counter() - game_start
+        return GameRecord(index, tuple(moves), self.game.result.value, tuple(move_times), duration)
+
+    def update_strategies(self) -> None:
+        """Let the players learn from the outcome of the finished game."""
         for player in self.players.values():
             player.update_strategy(self.game.result.value)
 
+    def reset(self) -> None:
+        """Reset the game."""
         self.game.reset()
@@ -0,0 +1,53 @@
+"""Game pipeline module.
+
+Stages for the stream of GameRecords yielded by `GameController.stream_games`. Every stage takes an iterable of records
+and lazily yields records (or chunks of them), so stages compose into pipelines that play, analyse and train one game at
+a time in constant memory:
+
+    records = controller.stream_games(10_000)
+    records = publish_records(records, trackers_publisher, board_size=3)
+    records = filter_records(records, lambda record: record.winner == GameSymbol.O)
+    for chunk in chunked(records, 500):
+        ...
+"""
+import itertools
+from collections.abc import Callable, Iterable, Iterator
+
+from library.controller import GamePublisher, GameRecord
+from library.model import GameSymbol, TicTacToe
+
+
+def filter_records(records: Iterable[GameRecord], predicate: Callable[[GameRecord], bool]) -> Iterator[GameRecord]:
+    """Yields the records the predicate holds for."""
+    return (record for record in records if predicate(record))
+
+
+def tap(records: Iterable[GameRecord], callback: Callable[[GameRecord], None]) -> Iterator[GameRecord]:
+    """Calls the callback with every record, e.g. to log it, and yields the record unchanged."""
+    for record in records:
+        callback(record)
+        yield record
+
+
+def chunked(records: Iterable[GameRecord], size: int) -> Iterator[tuple[GameRecord, ...]]:
+    """Yields the records in tuples of the given size, the last one possibly shorter."""
+    if size < 1:
+        raise ValueError(f"Chunk size must be positive, got {size}.")
+
+    iterator = iter(records)
+    while chunk := tuple(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def publish_records(records: Iterable[GameRecord], publisher: GamePublisher, board_size: int = 3) -> Iterator[GameRecord]:
+    """Replays the moves of every record to the publisher's subscribers, then yields the record.
+
+    Subscribers such as statistics trackers see the same notifications as when subscribed to the GameController, so they
+    can be attached to any stage of a pipeline, for instance after a filter.
+    """
+    for record in records:
+        game = TicTacToe.from_board_size(board_size)
+        for move, symbol in zip(record.moves, itertools.cycle([GameSymbol.X, GameSymbol.O])):
+            game.place_symbol(move, symbol)
+            publisher.publish(game)
+        yield record
@@ -0,0 +1,32 @@
+"""Game record module."""
+from dataclasses import dataclass
+
+from library.model import GameSymbol
+
+
+@dataclass(frozen=True, slots=True)
+class GameRecord:
+    """Immutable summary of a finished game.
+
+    Attributes:
+        index: Position of the game in the run, starting at 0.
+        moves: The cells played, in order. X plays the even moves and O the odd ones.
+        winner: The winning symbol, or NONE for a tie.
+        move_times: Seconds each player took to choose each move.
+        duration: Seconds the whole game took, including publishing the moves.
+    """
+
+    index: int
+    moves: tuple[int, ...]
+    winner: GameSymbol
+    move_times: tuple[float, ...]
+    duration: float
+
+    @property
+    def length(self) -> int:
+        """Returns the number of moves in the game."""
+        return len(self.moves)
+
+    def players(self) -> tuple[GameSymbol, ...]:
+        """Returns the symbol that made each move."""
+        return tuple(GameSymbol.X if move % 2 == 0 else GameSymbol.O for move in range(self.length))
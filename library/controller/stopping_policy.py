@@ -0,0 +1,10 @@
+"""Module for the StoppingPolicy interface."""
+from abc import ABC, abstractmethod
+
+
+class StoppingPolicy(ABC):
+    """Decides whether a run of games can end before the requested number of games is played."""
+
+    @abstractmethod
+    def should_stop(self) -> bool:
+        """Returns True if the run should stop after the game that just finished."""
@@ -1,3 +1,5 @@
 """Initializes the model package"""
 
 from .game import GameResult, GameStatus, GameSymbol, TicTacToe
+from .shared_board_batch import SharedBoardBatch
+from .state_table import StateTable, state_table
@@ -6,10 +6,16 @@ from typing import Optional
 
 import numpy as np
 
+from library.model.state_table import BOARD_SIZE, CELL_POWERS, EMPTY_DIGIT, NO_STATE, O_DIGIT, X_DIGIT, state_table
+
 
 class TicTacToe:
     """Tic Tac Toe board.
 
+    On 3x3 boards reachable in a legal game, the board also tracks its index in the table of reachable states, so moves,
+    empty cells, turns and results are looked up instead of computed. The board should therefore only be changed through
+    `place_symbol` and `reset`.
+
     Attributes:
         board: The game board.
         state: The state of the game.
@@ -22,6 +28,7 @@ class TicTacToe:
         self.result = starting_result
 
         self._board_size = board_size
+        self._state_index = self._find_state_index()
 
     @staticmethod
     def from_board_size(board_size: int) -> TicTacToe:
@@ -38,20 +45,41 @@ class TicTacToe:
         if self.state != GameStatus.IN_PROGRESS:
             raise GameError("Invalid move. Game is over.")
 
+        index = self._state_index
+        table = state_table()
+        if index is not None and not table.terminal[index] and table.turns[index] == _SYMBOL_DIGITS[symbol]:
+            if cell not in table.legal_moves[index]:
+                raise GameError(f"Invalid move. Cell {cell} is not empty.")
+
+            row, col = divmod(cell, self._board_size)
+            self.board[row, col] = symbol
+            self._state_index = index = int(table.successors[index, cell])
+            if table.terminal[index]:
+                self.result = _WINNER_RESULTS[table.winners[index]]
+                self.state = GameStatus.GAME_OVER
+            return
+
         if cell not in self.empty_cells():
             raise GameError(f"Invalid move. Cell {cell} is not empty.")
 
         row, col = divmod(cell, self._board_size)
         self.board[row, col] = symbol
         self._update_state()
+        self._state_index = self._find_state_index()
 
     def empty_cells(self) -> list[int]:
         """Returns a list of empty cells."""
+        if self._state_index is not None and not state_table().terminal[self._state_index]:
+            return list(state_table().legal_moves[self._state_index])
+
         empty_indexes = np.where(np.ndarray.flatten(self.board) == GameSymbol.NONE)
         return empty_indexes[0].tolist()
 
     def current_turn(self) -> GameSymbol:
         """Returns the symbol of the current turn."""
+        if self._state_index is not None:
+            return _DIGIT_SYMBOLS[state_table().turns[self._state_index]]
+
         x_count = np.count_nonzero(self.board == GameSymbol.X)
         o_count = np.count_nonzero(self.board == GameSymbol.O)
 
@@ -61,6 +89,21 @@ class TicTacToe:
         """Reset the board."""
         self.board = np.full((self._board_size, self._board_size), GameSymbol.NONE)
         self.state = GameStatus.IN_PROGRESS
+        self._state_index = 0 if self._board_size == BOARD_SIZE else None
+
+    @property
+    def state_index(self) -> Optional[int]:
+        """Returns the index of the board in the table of reachable 3x3 states, or None if it is not in the table."""
+        return self._state_index
+
+    def _find_state_index(self) -> Optional[int]:
+        """Returns the index of the board in the table of reachable 3x3 states, or None if it is not in the table."""
+        if self._board_size != BOARD_SIZE:
+            return None
+
+        digits = X_DIGIT * (self.board == GameSymbol.X).ravel() + O_DIGIT * (self.board == GameSymbol.O).ravel()
+        index = int(state_table().indexes[digits @ CELL_POWERS])
+        return None if index == NO_STATE else index
 
     def _update_state(self) -> None:
         """Update the state of the board."""
@@ -96,7 +139,7 @@ class TicTacToe:
         """Check if there is a winner in a line."""
         line = np.array([cell.value for cell in line])
         unique_elements = np.unique(line)
-        if len(unique_elements) == 1 and unique_elements[0] is not GameSymbol.NONE.value:
+        if len(unique_elements) == 1 and unique_elements[0] != GameSymbol.NONE.value:
             return GameSymbol(unique_elements[0])
         return None
 
@@ -151,3 +194,9 @@ class GameStatus(Enum):
 
 class GameError(Exception):
     """Exception raised for errors in the game."""
+
+
+# Conversions between symbols and results and the digits of the state table
+_SYMBOL_DIGITS = {GameSymbol.NONE: EMPTY_DIGIT, GameSymbol.X: X_DIGIT, GameSymbol.O: O_DIGIT}
+_DIGIT_SYMBOLS = {digit: symbol for symbol, digit in _SYMBOL_DIGITS.items()}
+_WINNER_RESULTS = {EMPTY_DIGIT: GameResult.TIE, X_DIGIT: GameResult.X_WIN, O_DIGIT: GameResult.O_WIN}
@@ -0,0 +1,149 @@
+"""Shared board batch module."""
+from __future__ import annotations
+
+from multiprocessing import shared_memory
+from typing import Optional, Union
+
+import numpy as np
+
+from library.model.game import GameError, GameResult, GameStatus, GameSymbol, TicTacToe
+
+# Cell codes of the boards: X and O cancel out, so a line summing to +-board_size is a win
+EMPTY = 0
+X_CELL = 1
+O_CELL = -1
+# Indexed by cell code, so -1 picks O
+CELL_SYMBOLS = np.array([GameSymbol.NONE, GameSymbol.X, GameSymbol.O], dtype=object)
+CELL_CHARACTERS = np.array([ord(symbol.value) for symbol in CELL_SYMBOLS], dtype=np.uint8)
+
+# Result codes of the games
+IN_PROGRESS = 0
+X_WIN = X_CELL
+O_WIN = O_CELL
+TIE = 2
+RESULT_SYMBOLS = {X_WIN: GameSymbol.X, O_WIN: GameSymbol.O, TIE: GameSymbol.NONE}
+
+Rows = Union[slice, np.ndarray]
+
+
+class SharedBoardBatch:
+    """Boards, results and move counts of many games, stored in one block of shared memory.
+
+    Boards are int8 arrays of cell codes (EMPTY, X_CELL, O_CELL). Pickling a batch only sends the name of its shared
+    memory block, so a batch passed to a worker process is attached to, not copied: workers apply moves in place to
+    disjoint rows, and the process that created the batch reads the results without any transfer.
+
+    The process that creates a batch owns its memory and must `unlink` it (or use the batch as a context manager) once
+    every process is done with it.
+
+    Attributes:
+        num_games: Number of games in the batch.
+        board_size: Size of the boards.
+        boards: The boards, shaped (num_games, board_size, board_size).
+        results: The result code of every game, IN_PROGRESS until it is over.
+        move_counts: The number of moves played in every game.
+    """
+
+    def __init__(self, num_games: int, board_size: int = 3, name: Optional[str] = None) -> None:
+        """Create a batch of empty boards, or attach to the batch with the given shared memory name."""
+        self.num_games = num_games
+        self.board_size = board_size
+        num_cells = board_size**2
+        size = num_games * (num_cells + 2)
+
+        self._owner = name is None
+        if self._owner:
+            self._memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+            self._memory.buf[:size] = bytes(size)
+        else:
+            self._memory = shared_memory.SharedMemory(name=name)
+
+        buffer = self._memory.buf
+        self.boards = np.ndarray((num_games, board_size, board_size), dtype=np.int8, buffer=buffer)
+        self.results = np.ndarray((num_games,), dtype=np.int8, buffer=buffer, offset=num_games * num_cells)
+        self.move_counts = np.ndarray((num_games,), dtype=np.uint8, buffer=buffer, offset=num_games * (num_cells + 1))
+
+    @property
+    def name(self) -> str:
+        """Returns the name of the shared memory block."""
+        return self._memory.name
+
+    def current_turns(self, rows: Rows = slice(None)) -> np.ndarray:
+        """Returns the cell code of the player to move in each of the games."""
+        return np.where(self.move_counts[rows] % 2 == 0, X_CELL, O_CELL).astype(np.int8)
+
+    def empty_cells(self, rows: Rows = slice(None)) -> np.ndarray:
+        """Returns a boolean mask of the empty cells of each of the games, shaped (games, cells)."""
+        return self.boards[rows].reshape(-1, self.board_size**2) == EMPTY
+
+    def apply_moves(self, rows: np.ndarray, cells: np.ndarray) -> None:
+        """Place the symbol of the player to move in a cell of each of the games, and update their results.
+
+        Args:
+            rows: Indexes of the games, all in progress and without duplicates.
+            cells: The cell to play in each of the games.
+        """
+        rows = np.asarray(rows)
+        cells = np.asarray(cells)
+        if np.any(self.results[rows] != IN_PROGRESS):
+            raise GameError("Invalid move. Game is over.")
+
+        flat_boards = self.boards.reshape(self.num_games, -1)
+        if np.any(flat_boards[rows, cells] != EMPTY):
+            raise GameError("Invalid move. Cell is not empty.")
+
+        flat_boards[rows, cells] = self.current_turns(rows)
+        self.move_counts[rows] += 1
+        self.results[rows] = self._results(rows)
+
+    def games(self, rows: Rows = slice(None)) -> list[TicTacToe]:
+        """Returns copies of the games as TicTacToe objects, e.g. for agents without a batch move method."""
+        statuses = {IN_PROGRESS: (GameStatus.IN_PROGRESS, GameResult.INVALID)}
+        statuses.update({code: (GameStatus.GAME_OVER, GameResult(symbol)) for code, symbol in RESULT_SYMBOLS.items()})
+        return [
+            TicTacToe(self.board_size, CELL_SYMBOLS[board], *statuses[int(result)]) for board, result in zip(self.boards[rows], self.results[rows])
+        ]
+
+    def reset(self, rows: Rows = slice(None)) -> None:
+        """Clear the games for a new round."""
+        self.boards[rows] = EMPTY
+        self.results[rows] = IN_PROGRESS
+        self.move_counts[rows] = 0
+
+    def close(self) -> None:
+        """Detach this process from the shared memory."""
+        # Drop the views first, the memory cannot be closed while arrays still point into it
+        del self.boards, self.results, self.move_counts
+        self._memory.close()
+
+    def unlink(self) -> None:
+        """Free the shared memory once every process has closed it. Only the creating process may unlink it."""
+        if self._owner:
+            self._memory.unlink()
+
+    def _results(self, rows: np.ndarray) -> np.ndarray:
+        """Returns the result codes of the games after their last move."""
+        boards = self.boards[rows].astype(np.int16)
+        line_sums = np.concatenate(
+            [
+                boards.sum(axis=2),
+                boards.sum(axis=1),
+                np.trace(boards, axis1=1, axis2=2)[:, np.newaxis],
+                np.trace(np.flip(boards, axis=2), axis1=1, axis2=2)[:, np.newaxis],
+            ],
+            axis=1,
+        )
+        x_won = np.any(line_sums == self.board_size, axis=1)
+        o_won = np.any(line_sums == -self.board_size, axis=1)
+        full = self.move_counts[rows] == self.board_size**2
+        return np.select([x_won, o_won, full], [X_WIN, O_WIN, TIE], IN_PROGRESS)
+
+    def __enter__(self) -> SharedBoardBatch:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+        self.unlink()
+
+    def __reduce__(self) -> tuple:
+        return SharedBoardBatch, (self.num_games, self.board_size, self.name)
@@ -0,0 +1,30 @@
+"""Solved 3x3 Tic Tac Toe positions module."""
+from functools import cache
+
+import numpy as np
+
+from library.model.game import GameSymbol
+from library.model.state_table import CELL_POWERS, NUM_CELLS, state_table
+
+# Value stored for positions that cannot be reached in a legal game.
+UNREACHABLE = -128
+
+
+def board_code(board: np.ndarray) -> int:
+    """Returns the base 3 code of a 3x3 board."""
+    digits = (board == GameSymbol.X).ravel() + 2 * (board == GameSymbol.O).ravel()
+    return int(digits @ CELL_POWERS)
+
+
+@cache
+def solved_values() -> np.ndarray:
+    """Returns the game theoretic value of every 3x3 position, indexed by board code.
+
+    Values are from X's perspective under perfect play by both players: 1 if X wins, 0 for a tie and -1 if O wins.
+    Positions that cannot occur in a legal game hold UNREACHABLE. The values are spread out from the solved state table.
+    """
+    table = state_table()
+    values = np.full(3**NUM_CELLS, UNREACHABLE, dtype=np.int8)
+    values[table.codes] = table.values
+    values.setflags(write=False)
+    return values
@@ -0,0 +1,171 @@
+"""Reachable 3x3 Tic Tac Toe state table module.
+
+There are only 5478 positions that can occur in a legal 3x3 game. They are enumerated once into a dense index together
+with everything a move needs: the legal moves, the successor of every move, whether the position is over, its winner
+and its solved value. Playing a move on a 3x3 board is then a few array lookups instead of scanning the board.
+
+The table is built on first use and saved to disk, so later processes only load it.
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+import zipfile
+from functools import cache
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+BOARD_SIZE = 3
+NUM_CELLS = BOARD_SIZE**2
+
+# Positions are encoded in base 3, one digit per cell in row-major order (0 empty, 1 X, 2 O).
+EMPTY_DIGIT = 0
+X_DIGIT = 1
+O_DIGIT = 2
+CELL_POWERS = 3 ** np.arange(NUM_CELLS)
+
+# Index stored for codes and successors of positions that cannot be reached in a legal game.
+NO_STATE = -1
+
+LINES = [
+    *[[row * BOARD_SIZE + col for col in range(BOARD_SIZE)] for row in range(BOARD_SIZE)],
+    *[[row * BOARD_SIZE + col for row in range(BOARD_SIZE)] for col in range(BOARD_SIZE)],
+    [i * (BOARD_SIZE + 1) for i in range(BOARD_SIZE)],
+    [(i + 1) * (BOARD_SIZE - 1) for i in range(BOARD_SIZE)],
+]
+
+STATE_TABLE_PATH = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "tic-tac-brainiac" / "state_table_3x3.npz"
+
+
+class StateTable:
+    """Every reachable 3x3 position, indexed densely in the order they are reached from the empty board.
+
+    The empty board has index 0, and positions are ordered by their number of moves.
+
+    Attributes:
+        codes: The base 3 code of every position.
+        indexes: The index of every base 3 code, NO_STATE for unreachable codes.
+        successors: The index of the position after playing each cell, NO_STATE if the cell is taken or the game is over.
+        turns: The digit of the player to move.
+        winners: The digit of the winner, EMPTY_DIGIT if there is none (yet).
+        terminal: Whether the game is over.
+        values: The game theoretic value from X's perspective under perfect play: 1 if X wins, 0 for a tie and -1 if O
+            wins.
+        legal_moves: The legal moves of every position, as tuples of cells.
+    """
+
+    ARRAYS = ("codes", "successors", "turns", "winners", "terminal", "values")
+
+    def __init__(
+        self,
+        codes: np.ndarray,
+        successors: np.ndarray,
+        turns: np.ndarray,
+        winners: np.ndarray,
+        terminal: np.ndarray,
+        values: np.ndarray,
+    ) -> None:
+        """Initialize a StateTable from its arrays; use `build` or `load` to obtain one."""
+        self.codes = codes
+        self.successors = successors
+        self.turns = turns
+        self.winners = winners
+        self.terminal = terminal
+        self.values = values
+
+        self.indexes = np.full(3**NUM_CELLS, NO_STATE, dtype=np.int32)
+        self.indexes[codes] = np.arange(len(codes))
+        self.legal_moves: tuple[tuple[int, ...], ...] = tuple(tuple(np.flatnonzero(row >= 0).tolist()) for row in successors)
+        for array in (self.indexes, *(getattr(self, name) for name in self.ARRAYS)):
+            array.setflags(write=False)
+
+    @classmethod
+    def build(cls) -> StateTable:
+        """Enumerate every reachable position breadth first from the empty board, and solve them."""
+        codes = [0]
+        indexes = {0: 0}
+        successors, turns, winners = [], [], []
+
+        # New codes are appended behind the ones still to be visited, so this visits every position once, level by level
+        visited = 0
+        while visited < len(codes):
+            code = codes[visited]
+            visited += 1
+            cells = [code // 3**cell % 3 for cell in range(NUM_CELLS)]
+            winner = next((cells[a] for a, b, c in LINES if cells[a] != EMPTY_DIGIT and cells[a] == cells[b] == cells[c]), EMPTY_DIGIT)
+            turn = X_DIGIT if cells.count(X_DIGIT) == cells.count(O_DIGIT) else O_DIGIT
+            row = [NO_STATE] * NUM_CELLS
+            if winner == EMPTY_DIGIT:
+                for cell in range(NUM_CELLS):
+                    if cells[cell] == EMPTY_DIGIT:
+                        successor = code + turn * 3**cell
+                        if successor not in indexes:
+                            indexes[successor] = len(codes)
+                            codes.append(successor)
+                        row[cell] = indexes[successor]
+
+            successors.append(row)
+            turns.append(turn)
+            winners.append(winner)
+
+        successors = np.array(successors, dtype=np.int32)
+        winners = np.array(winners, dtype=np.int8)
+        terminal = np.all(successors == NO_STATE, axis=1)
+
+        # Every successor has a higher index, so solving backwards solves it first
+        values = np.zeros(len(codes), dtype=np.int8)
+        values[winners == X_DIGIT] = 1
+        values[winners == O_DIGIT] = -1
+        for index in np.flatnonzero(~terminal)[::-1]:
+            outcomes = values[successors[index][successors[index] >= 0]]
+            values[index] = outcomes.max() if turns[index] == X_DIGIT else outcomes.min()
+
+        return cls(np.array(codes, dtype=np.int32), successors, np.array(turns, dtype=np.int8), winners, terminal, values)
+
+    def save(self, path: Path) -> None:
+        """Save the table's arrays to an .npz file.
+
+        The arrays are written to a temporary file that then replaces the file, so processes saving the table at the same
+        time never leave a partly written file behind.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False) as file:
+            temporary_path = Path(file.name)
+            try:
+                np.savez(file, **{name: getattr(self, name) for name in self.ARRAYS})
+            except BaseException:
+                temporary_path.unlink()
+                raise
+        temporary_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> StateTable:
+        """Load a table saved with `save`."""
+        with np.load(path) as arrays:
+            return cls(*(arrays[name] for name in cls.ARRAYS))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+@cache
+def state_table(path: Optional[Path] = STATE_TABLE_PATH) -> StateTable:
+    """Returns the table of reachable 3x3 positions, loaded once per process.
+
+    The table is loaded from the given file, or built and saved there if the file is missing or unreadable. Pass None to
+    always build it in memory.
+    """
+    if path is None:
+        return StateTable.build()
+
+    try:
+        return StateTable.load(path)
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        table = StateTable.build()
+        try:
+            table.save(path)
+        except OSError:
+            pass
+        return table
@@ -1,4 +1,5 @@
 """Initializes the statistics package, importing various statistic tracker types."""
+from .downsampled_series import DownsampledSeries
 from .statistic_tracker import StatisticsTracker
 
 from .win_tracker import WinTracker
@@ -11,3 +12,11 @@ from .rolling_winrate_tracker import RollingWinRateTracker
 from .batch_win_tracker import BatchWinTracker
 
 from .game_length_tracker import GameLengthTracker
+from .game_length_distribution_tracker import GameLengthDistributionTracker
+from .streak_distribution_tracker import StreakDistributionTracker
+from .move_latency_tracker import MoveLatencyTracker
+
+from .move_quality_tracker import MoveQualityTracker
+
+from .live_dashboard import LiveDashboard
+from .artifact_export import export_plots
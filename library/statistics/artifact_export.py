@@ -0,0 +1,47 @@
+"""Artifact export module."""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import matplotlib
+
+from library.statistics import StatisticsTracker
+
+
+def export_plots(
+    trackers: list[StatisticsTracker],
+    directory: Path,
+    file_formats: tuple[str, ...] = ("png", "svg"),
+    max_workers: Optional[int] = None,
+) -> None:
+    """Render the plots of all trackers in parallel on a non-interactive backend and save them to a directory.
+
+    Each tracker is plotted in its own worker process, so exporting takes about as long as the slowest plot.
+
+    Args:
+        trackers: The trackers to plot.
+        directory: The directory to save the plots in.
+        file_formats: The image formats to save each plot in.
+        max_workers: Maximum number of worker processes (default: one per tracker, capped at the CPU count).
+    """
+    if not trackers:
+        return
+
+    max_workers = max_workers or min(len(trackers), multiprocessing.cpu_count())
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers, mp_context=context, initializer=_use_headless_backend) as executor:
+        futures = [executor.submit(_render_plot, tracker, directory, file_formats) for tracker in trackers]
+        for future in futures:
+            future.result()
+
+
+def _use_headless_backend() -> None:
+    """Switch the worker process to the non-interactive Agg backend."""
+    matplotlib.use("Agg", force=True)
+
+
+def _render_plot(tracker: StatisticsTracker, directory: Path, file_formats: tuple[str, ...]) -> None:
+    """Save the plot of a single tracker in the given formats."""
+    tracker.file_formats = file_formats
+    tracker.plot_statistics(directory=directory)
@@ -2,67 +2,76 @@
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 from matplotlib import pyplot as plt
 from library.model import TicTacToe
 
 from library.model.game import GameSymbol
-from library.statistics import StatisticsTracker
+from library.statistics import DownsampledSeries, StatisticsTracker
 
 
 class BatchWinTracker(StatisticsTracker):
     """Tracks win statistics for Tic-Tac-Toe games in batches.
 
     Attributes:
-        wins: A list that keeps track of the number of wins for each batch (X and O).
-        ties: A list that keeps track of the number of ties for each batch.
+        wins: A dictionary of lists that keeps track of the number of wins of each player (X and O) in each batch.
+        ties: A list that keeps track of the number of ties in each batch.
     """
 
-    def __init__(self, batch_size: int = 100) -> None:
-        """Initialize a WinBatchTracker object."""
+    def __init__(self, batch_size: int = 100, retention: Optional[int] = None) -> None:
+        """Initialize a WinBatchTracker object, downsampling all but the last `retention` batches if given."""
         super().__init__()
         self.batch_size = batch_size
-        self.wins: list[dict[GameSymbol, int]] = []
-        self.ties: list[int] = []
+        self.retention = retention
+        self.wins: dict[GameSymbol, list[int]] = {GameSymbol.X: self._new_series(), GameSymbol.O: self._new_series()}
+        self.ties: list[int] = self._new_series()
 
     def update_statistics_on_win(self, winner: GameSymbol) -> None:
         """Update win statistics based on the winner of a game."""
         if (self.total_games - 1) % self.batch_size == 0:
-            self.wins.append({GameSymbol.X: 0, GameSymbol.O: 0})
-            self.ties.append(0)
+            for series in [self.wins[GameSymbol.X], self.wins[GameSymbol.O], self.ties]:
+                series.append(0)
 
         if winner is GameSymbol.NONE:
             self.ties[-1] += 1
         else:
-            self.wins[-1][winner] += 1
+            self.wins[winner][-1] += 1
 
     def update_statistics_on_move(self, game: TicTacToe) -> None:
         """Update win statistics based on the move of a game."""
 
     def plot_statistics(self, directory: Optional[Path] = None, display: bool = False, figsize: tuple = (8, 6)) -> None:
         """Generate and optionally save or display win statistics plots for each batch on the same plot."""
-        num_batches = len(self.wins)
         bar_width = 0.2
-        bar_positions = range(num_batches)
 
         plt.figure(figsize=figsize)
 
         # First three default colors in matplotlib's color theme
         colors = plt.rcParams["axes.prop_cycle"].by_key()["color"][:3]
-        for batch_index in range(num_batches):
-            x_wins = self.wins[batch_index][GameSymbol.X]
-            o_wins = self.wins[batch_index][GameSymbol.O]
-            ties = self.ties[batch_index]
+        starts, counts, x_wins = self._batch_means(self.wins[GameSymbol.X])
+        o_wins = self._batch_means(self.wins[GameSymbol.O])[2]
+        ties = self._batch_means(self.ties)[2]
 
-            pos = batch_index * bar_width
-            plt.bar(pos, [x_wins], bar_width, color=colors[0])
-            plt.bar(pos, [o_wins], bar_width, bottom=[x_wins], color=colors[1])
-            plt.bar(pos, [ties], bar_width, bottom=[x_wins + o_wins], color=colors[2])
+        # Downsampled batches are drawn as one wide bar with their mean counts
+        positions = (starts + (counts - 1) / 2) * bar_width
+        widths = counts * bar_width
+        plt.bar(positions, x_wins, widths, color=colors[0])
+        plt.bar(positions, o_wins, widths, bottom=x_wins, color=colors[1])
+        plt.bar(positions, ties, widths, bottom=x_wins + o_wins, color=colors[2])
 
         plt.xlabel("Batches")
         plt.ylabel("Number of Games")
         plt.title("Win Stats by Batch")
-        plt.xticks([pos * bar_width for pos in bar_positions], [f"{i + 1}" for i in bar_positions], rotation="vertical", fontsize=4)
+        plt.xticks(starts * bar_width, [f"{start + 1}" for start in starts], rotation="vertical", fontsize=4)
         plt.legend(["X Wins", "O Wins", "Ties"])
 
         filename = directory / "win_stats_by_batch.png" if directory else None
         self._display_plot(filename, display)
+
+    @staticmethod
+    def _batch_means(values: list[int]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the first batch, number of batches and mean value of every stored point of a per-batch series."""
+        if isinstance(values, DownsampledSeries):
+            starts, counts, _, means, _ = values.buckets()
+            return starts, counts, means
+        return np.arange(len(values)), np.ones(len(values), dtype=int), np.array(values, dtype=float)
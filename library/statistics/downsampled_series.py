@@ -0,0 +1,132 @@
+"""Downsampled series module."""
+from collections.abc import Iterator
+from typing import Union
+
+import numpy as np
+
+# A bucket of consecutive values: [start index, count, minimum, sum, maximum]
+Bucket = list
+
+
+class DownsampledSeries:
+    """Append-only series of numbers that keeps its recent values exactly and older values in ever coarser buckets.
+
+    Like a round-robin database, the series is stored in tiers. The most recent `recent` values are kept as they are.
+    Older values are aggregated `factor` at a time into buckets holding their minimum, mean and maximum, and every
+    further level aggregates `factor` buckets of the level before. Once the oldest level is full, its neighbouring
+    buckets are merged in pairs. Memory therefore stays bounded however many values are appended, while the series still
+    covers its whole history.
+
+    The series behaves like a list of all values ever appended where it matters for trackers: `len` counts every value,
+    and indexing or slicing returns the exact values for recent indexes and the bucket means for older ones.
+
+    Attributes:
+        recent: Number of most recent values kept at full resolution.
+        factor: Number of values or buckets aggregated into one bucket of the next level.
+        levels: Number of bucket levels.
+        capacity: Number of buckets per level.
+    """
+
+    def __init__(self, recent: int = 1000, factor: int = 10, levels: int = 3, capacity: int = 500) -> None:
+        """Initialize an empty DownsampledSeries."""
+        if recent < 1 or factor < 2 or levels < 1 or capacity < 2:
+            raise ValueError("A DownsampledSeries needs recent >= 1, factor >= 2, levels >= 1 and capacity >= 2.")
+
+        self.recent = recent
+        self.factor = factor
+        self.levels = levels
+        self.capacity = capacity
+        self._values: list[float] = []
+        # Level 0 holds the newest buckets, the last level the oldest
+        self._levels: list[list[Bucket]] = [[] for _ in range(levels)]
+        self._length = 0
+
+    def append(self, value: float) -> None:
+        """Append a value to the series."""
+        self._values.append(value)
+        self._length += 1
+        if len(self._values) < self.recent + self.factor:
+            return
+
+        oldest = self._values[: self.factor]
+        del self._values[: self.factor]
+        self._levels[0].append([self._length - len(self._values) - self.factor, self.factor, min(oldest), sum(oldest), max(oldest)])
+        self._compact()
+
+    def buckets(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the start index, count, minimum, mean and maximum of every bucket, oldest first.
+
+        Recent values are returned as buckets of a single value.
+        """
+        stored = [bucket for level in reversed(self._levels) for bucket in level]
+        first_recent = self._length - len(self._values)
+        stored += [[first_recent + offset, 1, value, value, value] for offset, value in enumerate(self._values)]
+        if not stored:
+            return tuple(np.zeros(0) for _ in range(5))
+
+        starts, counts, minimums, sums, maximums = np.array(stored, dtype=float).T
+        return starts.astype(int), counts.astype(int), minimums, sums / counts, maximums
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[float, list[float]]:
+        first_recent = self._length - len(self._values)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step == 1 and start >= first_recent:
+                return self._values[start - first_recent : stop - first_recent]
+            return [self[position] for position in range(start, stop, step)]
+
+        position = index + self._length if index < 0 else index
+        if not 0 <= position < self._length:
+            raise IndexError("DownsampledSeries index out of range")
+        if position >= first_recent:
+            return self._values[position - first_recent]
+
+        for level in self._levels:
+            for start, count, _, total, _ in level:
+                if start <= position < start + count:
+                    return total / count
+        raise IndexError("DownsampledSeries index out of range")
+
+    def __setitem__(self, index: int, value: float) -> None:
+        first_recent = self._length - len(self._values)
+        position = index + self._length if index < 0 else index
+        if not first_recent <= position < self._length:
+            raise IndexError("Only the recent values of a DownsampledSeries can be changed")
+        self._values[position - first_recent] = value
+
+    def __iter__(self) -> Iterator[float]:
+        for level in reversed(self._levels):
+            for _, count, _, total, _ in level:
+                for _ in range(count):
+                    yield total / count
+        yield from self._values
+
+    def _compact(self) -> None:
+        """Move the oldest buckets of every full level into the next level, merging the oldest level in pairs."""
+        for level_index, level in enumerate(self._levels):
+            if len(level) < self.capacity + self.factor:
+                continue
+
+            if level_index + 1 < self.levels:
+                oldest = level[: self.factor]
+                del level[: self.factor]
+                self._levels[level_index + 1].append(_merge(oldest))
+            else:
+                level[:] = [_merge(level[start : start + 2]) for start in range(0, len(level), 2)]
+
+    def __repr__(self) -> str:
+        return f"DownsampledSeries(length={self._length}, stored={len(self._values) + sum(map(len, self._levels))})"
+
+
+def _merge(buckets: list[Bucket]) -> Bucket:
+    """Returns one bucket covering consecutive buckets."""
+    return [
+        buckets[0][0],
+        sum(bucket[1] for bucket in buckets),
+        min(bucket[2] for bucket in buckets),
+        sum(bucket[3] for bucket in buckets),
+        max(bucket[4] for bucket in buckets),
+    ]
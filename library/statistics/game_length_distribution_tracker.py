@@ -0,0 +1,66 @@
+"""GameLengthDistributionTracker module."""
+from pathlib import Path
+from typing import Optional
+
+from matplotlib import pyplot as plt
+
+from library.model import GameStatus, GameSymbol, TicTacToe
+from library.statistics import StatisticsTracker
+from library.statistics.streaming_sketch import CountHistogram
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class GameLengthDistributionTracker(StatisticsTracker):
+    """Tracks the distribution of game lengths over all games in constant memory.
+
+    Attributes:
+        histogram: The number of games of every length, created once the board size is known.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a GameLengthDistributionTracker object."""
+        super().__init__()
+        self.histogram: Optional[CountHistogram] = None
+        self._current_game_length = 0
+
+    def notify(self, game: TicTacToe) -> None:
+        """Counts every move, including the one that ends the game, then updates the statistics."""
+        self.update_statistics_on_move(game)
+        if game.state == GameStatus.GAME_OVER:
+            self.total_games += 1
+            self.update_statistics_on_win(game.result.value)
+
+    def update_statistics_on_move(self, game: TicTacToe) -> None:
+        """Count the move."""
+        if self.histogram is None:
+            # A game lasts at most one move per cell
+            self.histogram = CountHistogram(game.rows * game.cols + 1)
+        self._current_game_length += 1
+
+    def update_statistics_on_win(self, winner: GameSymbol) -> None:
+        """Add the length of the completed game to the histogram."""
+        self.histogram.add(self._current_game_length)
+        self._current_game_length = 0
+
+    def quantiles(self) -> dict[float, int]:
+        """Returns the p50, p95 and p99 game lengths."""
+        if self.histogram is None:
+            return {q: 0 for q in QUANTILES}
+        return {q: self.histogram.quantile(q) for q in QUANTILES}
+
+    def plot_statistics(self, directory: Optional[Path] = None, display: bool = False, figsize: tuple = (8, 6)) -> None:
+        """Generate and optionally save or display the game length distribution plot."""
+        plt.figure(figsize=figsize)
+        if self.histogram is not None:
+            plt.bar(range(len(self.histogram.counts)), self.histogram.counts, label="Games")
+            for color, (q, length) in enumerate(self.quantiles().items(), start=1):
+                plt.axvline(length, linestyle="--", color=f"C{color}", label=f"p{q * 100:g}: {length}")
+
+        plt.xlabel("Game Length (Number of Moves)")
+        plt.ylabel("Number of Games")
+        plt.title(f"Game Length Distribution ({self.total_games} Games)")
+        plt.legend()
+
+        filename = directory / "game_length_distribution.png" if directory else None
+        self._display_plot(filename, display)
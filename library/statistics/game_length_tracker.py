@@ -17,13 +17,14 @@ class GameLengthTracker(StatisticsTracker):
         average_game_lengths: A list to keep track of the average game length over the window size.
     """
 
-    def __init__(self, window_size: int) -> None:
-        """Initialize a GameLengthTracker object."""
+    def __init__(self, window_size: int, retention: Optional[int] = None) -> None:
+        """Initialize a GameLengthTracker object, downsampling all but the last `retention` games if given."""
         super().__init__()
-        self.game_lengths: list[int] = []
+        self.retention = retention
+        self.game_lengths: list[int] = self._new_series(window_size)
         self.current_game_length: int = 0
         self.window_size: int = window_size
-        self.average_game_lengths: list[float] = []
+        self.average_game_lengths: list[float] = self._new_series()
 
     def update_statistics_on_move(self, game: TicTacToe) -> None:
         """Update game length statistics based on the move of a game."""
@@ -46,11 +47,7 @@ class GameLengthTracker(StatisticsTracker):
         """Generate and optionally save or display game length statistics plots."""
         plt.figure(figsize=figsize)
         if self.average_game_lengths:
-            plt.plot(
-                range(self.total_games),
-                self.average_game_lengths,
-                label=f"Average (Window Size: {self.window_size})",
-            )
+            self._plot_series(self.average_game_lengths, f"Average (Window Size: {self.window_size})")
         plt.xlabel("Games")
         plt.ylabel("Game Length (Number of Moves)")
         plt.title("Game Length Stats")
@@ -58,10 +55,9 @@ class GameLengthTracker(StatisticsTracker):
         plt.ylim(bottom=0)
         plt.legend()
 
-        if directory:
-            directory.mkdir(parents=True, exist_ok=True)
-            filename = directory / "game_length_stats.png"
-            plt.savefig(filename)
+        filename = directory / "game_length_stats.png" if directory else None
+        self._display_plot(filename, display)
 
-        if display:
-            plt.show()
+    def series(self) -> dict[str, list[float]]:
+        """Returns the per-game average game length, keyed by line label."""
+        return {f"Average (Window Size: {self.window_size})": self.average_game_lengths}
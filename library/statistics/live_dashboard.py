@@ -0,0 +1,138 @@
+"""LiveDashboard module."""
+import multiprocessing
+import queue
+import time
+from typing import Optional
+
+from matplotlib import pyplot as plt
+
+from library.controller import GameSubscriber
+from library.model import GameStatus, TicTacToe
+from library.statistics import DownsampledSeries, StatisticsTracker
+
+
+class LiveDashboard(GameSubscriber):
+    """Shows the time series of statistics trackers live while games are being played.
+
+    The figure is drawn by a separate process that creates it once and only appends new points to the existing lines.
+    The game loop merely hands over the points added since the last refresh, at most once per refresh interval, and never
+    waits for the renderer: if it falls behind, the points are sent with the next refresh instead. The renderer keeps
+    every line as a DownsampledSeries, so its memory and the points redrawn per refresh stay bounded on long runs.
+
+    Must be added to the publisher after the trackers it shows, so that they are updated before it reads them.
+
+    Attributes:
+        trackers: The trackers shown on the dashboard, one panel each.
+        refresh_interval: Minimum number of seconds between two refreshes.
+        recent_points: Number of most recent points of every line drawn exactly, older points are drawn as bucket means.
+        figsize: Size of the dashboard figure.
+    """
+
+    def __init__(
+        self,
+        trackers: list[StatisticsTracker],
+        refresh_interval: float = 1.0,
+        recent_points: int = 1000,
+        figsize: tuple = (10, 8),
+    ) -> None:
+        """Initialize a LiveDashboard object."""
+        self.trackers = [tracker for tracker in trackers if tracker.series()]
+        self.refresh_interval = refresh_interval
+        self.recent_points = recent_points
+        self.figsize = figsize
+
+        self._sent = [{label: 0 for label in tracker.series()} for tracker in self.trackers]
+        self._last_refresh = 0.0
+        self._queue: Optional[multiprocessing.Queue] = None
+        self._process: Optional[multiprocessing.Process] = None
+
+    def start(self) -> None:
+        """Start the renderer process and open the dashboard."""
+        context = multiprocessing.get_context("spawn")
+        panels = [(type(tracker).__name__, list(tracker.series())) for tracker in self.trackers]
+        self._queue = context.Queue(maxsize=2)
+        self._process = context.Process(target=_render_dashboard, args=(self._queue, panels, self.recent_points, self.figsize), daemon=True)
+        self._process.start()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Send the remaining points and stop the renderer process."""
+        if self._process is None:
+            return
+
+        self.refresh()
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+        self._process = None
+
+    def notify(self, game: TicTacToe) -> None:
+        """Refreshes the dashboard at the end of a game once the refresh interval has passed."""
+        if game.state != GameStatus.GAME_OVER or self._process is None:
+            return
+
+        now = time.monotonic()
+        if now - self._last_refresh >= self.refresh_interval:
+            self._last_refresh = now
+            self.refresh()
+
+    def refresh(self) -> None:
+        """Send the points added since the last refresh to the renderer process."""
+        update = {}
+        for panel, tracker in enumerate(self.trackers):
+            for label, values in tracker.series().items():
+                start = self._sent[panel][label]
+                if len(values) > start:
+                    update[panel, label] = (start, [float(value) for value in values[start:]])
+
+        if not update:
+            return
+        try:
+            self._queue.put_nowait(update)
+        except queue.Full:
+            return
+
+        for (panel, label), (start, values) in update.items():
+            self._sent[panel][label] = start + len(values)
+
+
+def _render_dashboard(updates: multiprocessing.Queue, panels: list[tuple[str, list[str]]], recent_points: int, figsize: tuple) -> None:
+    """Draw the dashboard, appending the points received from the game process until it sends None."""
+    fig, axes = plt.subplots(len(panels), 1, figsize=figsize, squeeze=False)
+    lines = {}
+    for panel, (title, labels) in enumerate(panels):
+        ax = axes[panel][0]
+        for label in labels:
+            (lines[panel, label],) = ax.plot([], [], label=label)
+        ax.set_title(title)
+        ax.grid(True)
+        ax.legend(loc="upper left")
+    axes[-1][0].set_xlabel("Games")
+    fig.tight_layout()
+    plt.show(block=False)
+
+    data = {key: DownsampledSeries(recent_points) for key in lines}
+    while True:
+        try:
+            update = updates.get_nowait()
+        except queue.Empty:
+            plt.pause(0.1)
+            continue
+        if update is None:
+            break
+
+        for key, (start, values) in update.items():
+            # Points are sent from the first one not yet received, so at most a resent prefix is skipped
+            for value in values[len(data[key]) - start :]:
+                data[key].append(value)
+            starts, counts, _, means, _ = data[key].buckets()
+            lines[key].set_data(1 + starts + (counts - 1) / 2, means)
+        for ax in axes[:, 0]:
+            ax.relim()
+            ax.autoscale_view()
+        fig.canvas.draw_idle()
+
+    plt.close(fig)
@@ -0,0 +1,66 @@
+"""MoveLatencyTracker module."""
+from pathlib import Path
+from typing import Optional
+
+from matplotlib import pyplot as plt
+
+from library.controller import GameRecord
+from library.model import GameSymbol, TicTacToe
+from library.statistics import StatisticsTracker
+from library.statistics.streaming_sketch import QuantileSketch
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class MoveLatencyTracker(StatisticsTracker):
+    """Tracks approximate quantiles of the time each player takes per move, in constant memory.
+
+    Game notifications carry no timings, so the tracker is fed the GameRecords of `GameController.stream_games`, e.g.
+    `tap(controller.stream_games(num_games), tracker.add_record)`.
+
+    Attributes:
+        sketches: Per player, a sketch of the seconds taken per move.
+    """
+
+    def __init__(self, accuracy: float = 0.01) -> None:
+        """Initialize a MoveLatencyTracker object."""
+        super().__init__()
+        self.sketches = {GameSymbol.X: QuantileSketch(accuracy), GameSymbol.O: QuantileSketch(accuracy)}
+
+    def add_record(self, record: GameRecord) -> None:
+        """Add the move times of a finished game."""
+        self.total_games += 1
+        for player, move_time in zip(record.players(), record.move_times):
+            self.sketches[player].add(move_time)
+
+    def notify(self, game: TicTacToe) -> None:
+        """Move times are only known from game records, see `add_record`."""
+
+    def update_statistics_on_win(self, winner: GameSymbol) -> None:
+        """Move times are only known from game records, see `add_record`."""
+
+    def update_statistics_on_move(self, game: TicTacToe) -> None:
+        """Move times are only known from game records, see `add_record`."""
+
+    def quantiles(self, player: GameSymbol) -> dict[float, float]:
+        """Returns the p50, p95 and p99 seconds per move of a player."""
+        return {q: self.sketches[player].quantile(q) for q in QUANTILES}
+
+    def plot_statistics(self, directory: Optional[Path] = None, display: bool = False, figsize: tuple = (8, 6)) -> None:
+        """Generate and optionally save or display the move latency plot."""
+        plt.figure(figsize=figsize)
+
+        width = 0.25
+        for offset, q in zip([-width, 0, width], QUANTILES):
+            latencies = [self.sketches[player].quantile(q) * 1e6 for player in [GameSymbol.X, GameSymbol.O]]
+            plt.bar([offset, 1 + offset], latencies, width, label=f"p{q * 100:g}")
+
+        plt.xticks([0, 1], [GameSymbol.X.value, GameSymbol.O.value])
+        plt.xlabel("Players")
+        plt.ylabel("Time per Move (µs)")
+        plt.yscale("log")
+        plt.title("Move Latency Stats")
+        plt.legend()
+
+        filename = directory / "move_latency_stats.png" if directory else None
+        self._display_plot(filename, display)
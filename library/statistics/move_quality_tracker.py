@@ -0,0 +1,112 @@
+"""MoveQualityTracker module."""
+from collections import deque
+from pathlib import Path
+from typing import Optional
+
+from matplotlib import pyplot as plt
+
+from library.model import GameStatus, GameSymbol, TicTacToe
+from library.model.state_table import state_table
+from library.statistics import StatisticsTracker
+
+
+class MoveQualityTracker(StatisticsTracker):
+    """Tracks how far each player's moves fall short of perfect play on a 3x3 board.
+
+    Every move is scored against a table of solved positions: the regret of a move is how much it lowers the game
+    theoretic value for the player who made it (0 for an optimal move, 1 for throwing away a win or a tie, 2 for turning
+    a win into a loss), and any move with a positive regret is a blunder.
+
+    Attributes:
+        window_size: The number of games to average the blunder rate and regret over.
+        blunder_rates: Per player, the fraction of blunders over the window after each game.
+        average_regrets: Per player, the average regret per move over the window after each game.
+    """
+
+    def __init__(self, window_size: int) -> None:
+        """Initialize a MoveQualityTracker object."""
+        super().__init__()
+        self.window_size = window_size
+        self.blunder_rates: dict[GameSymbol, list[float]] = {GameSymbol.X: [], GameSymbol.O: []}
+        self.average_regrets: dict[GameSymbol, list[float]] = {GameSymbol.X: [], GameSymbol.O: []}
+
+        self._table = state_table()
+        self._previous_index = 0
+        self._game_moves = {GameSymbol.X: 0, GameSymbol.O: 0}
+        self._game_blunders = {GameSymbol.X: 0, GameSymbol.O: 0}
+        self._game_regret = {GameSymbol.X: 0, GameSymbol.O: 0}
+        self._window: dict[GameSymbol, deque[tuple[int, int, int]]] = {
+            GameSymbol.X: deque(maxlen=window_size),
+            GameSymbol.O: deque(maxlen=window_size),
+        }
+        self._window_totals = {GameSymbol.X: [0, 0, 0], GameSymbol.O: [0, 0, 0]}
+
+    def notify(self, game: TicTacToe) -> None:
+        """Scores every move, including the one that ends the game, then updates the statistics."""
+        self.update_statistics_on_move(game)
+        if game.state == GameStatus.GAME_OVER:
+            self.total_games += 1
+            self.update_statistics_on_win(game.result.value)
+
+    def update_statistics_on_move(self, game: TicTacToe) -> None:
+        """Score the move that led to the current position."""
+        if game.rows != 3:
+            raise ValueError(f"Move quality can only be tracked on 3x3 boards, got {game.rows}x{game.cols}.")
+
+        index = game.state_index
+        if index is None:
+            raise ValueError("Move quality can only be tracked on positions reachable in a legal game.")
+        player = game.current_turn().other()
+        sign = 1 if player == GameSymbol.X else -1
+        regret = sign * (int(self._table.values[self._previous_index]) - int(self._table.values[index]))
+
+        self._game_moves[player] += 1
+        self._game_blunders[player] += regret > 0
+        self._game_regret[player] += regret
+        self._previous_index = index
+
+    def update_statistics_on_win(self, winner: GameSymbol) -> None:
+        """Update the windowed blunder rates and regrets with the completed game."""
+        for player in [GameSymbol.X, GameSymbol.O]:
+            window = self._window[player]
+            if len(window) == self.window_size:
+                self._window_totals[player] = [total - oldest for total, oldest in zip(self._window_totals[player], window[0])]
+            game = (self._game_moves[player], self._game_blunders[player], self._game_regret[player])
+            window.append(game)
+            self._window_totals[player] = [total + latest for total, latest in zip(self._window_totals[player], game)]
+
+            moves, blunders, regret = self._window_totals[player]
+            self.blunder_rates[player].append(blunders / moves if moves else 0.0)
+            self.average_regrets[player].append(regret / moves if moves else 0.0)
+
+            self._game_moves[player] = 0
+            self._game_blunders[player] = 0
+            self._game_regret[player] = 0
+
+        self._previous_index = 0
+
+    def plot_statistics(self, directory: Optional[Path] = None, display: bool = False, figsize: tuple = (8, 6)) -> None:
+        """Generate and optionally save or display move quality statistics plots."""
+        plt.figure(figsize=figsize)
+
+        total_games_x_axis = range(1, self.total_games + 1)
+        for player in [GameSymbol.X, GameSymbol.O]:
+            plt.plot(total_games_x_axis, self.blunder_rates[player], label=f"{player.value} Blunder Rate")
+            plt.plot(total_games_x_axis, self.average_regrets[player], label=f"{player.value} Average Regret", linestyle="--")
+
+        plt.legend()
+        plt.xlabel("Total Games")
+        plt.ylabel("Per Move")
+        plt.title(f"Move Quality Stats (Window Size: {self.window_size} Games)")
+        plt.grid(True)
+        plt.ylim(bottom=0)
+
+        filename = directory / "move_quality_stats.png" if directory else None
+        self._display_plot(filename, display)
+
+    def series(self) -> dict[str, list[float]]:
+        """Returns the per-game blunder rates and average regrets, keyed by line label."""
+        return {
+            **{f"{player.value} Blunder Rate": self.blunder_rates[player] for player in [GameSymbol.X, GameSymbol.O]},
+            **{f"{player.value} Average Regret": self.average_regrets[player] for player in [GameSymbol.X, GameSymbol.O]},
+        }
@@ -12,17 +12,29 @@ class RollingWinTracker(StatisticsTracker):
     """Tracks rolling win statistics for Tic-Tac-Toe games within a specified window size.
 
     Attributes:
-        wins: A dictionary of deques that keeps track of the recent wins for each player (X and O) within the window.
-        ties: A deque that keeps track of the recent ties within the window.
+        wins: A dictionary of lists that keeps track of whether each player (X and O) won each game.
+        ties: A list that keeps track of whether each game was a tie.
+        rolling_wins: A dictionary of lists with the number of wins of each player within the window after each game.
+        rolling_ties: A list with the number of ties within the window after each game.
         window_size: The size of the window for tracking statistics.
     """
 
-    def __init__(self, window_size: int) -> None:
-        """Initialize a RollingWinTracker object with a specified window size."""
+    def __init__(self, window_size: int, retention: Optional[int] = None) -> None:
+        """Initialize a RollingWinTracker object with a specified window size.
+
+        Args:
+            window_size: The size of the window for tracking statistics.
+            retention: Number of recent games kept at full resolution, with older games downsampled, or None to keep
+                every game.
+        """
         super().__init__()
         self.window_size = window_size
-        self.wins: dict[GameSymbol, list] = {GameSymbol.X: [], GameSymbol.O: []}
-        self.ties: list = []
+        self.retention = retention
+        # The game leaving the window must still be at full resolution
+        self.wins: dict[GameSymbol, list] = {player: self._new_series(window_size + 1) for player in [GameSymbol.X, GameSymbol.O]}
+        self.ties: list = self._new_series(window_size + 1)
+        self.rolling_wins: dict[GameSymbol, list] = {GameSymbol.X: self._new_series(), GameSymbol.O: self._new_series()}
+        self.rolling_ties: list = self._new_series()
 
     def update_statistics_on_win(self, winner: GameSymbol) -> None:
         """Update rolling win statistics based on the winner of a game."""
@@ -35,6 +47,10 @@ class RollingWinTracker(StatisticsTracker):
             self.wins[GameSymbol.other(winner)].append(0)
             self.ties.append(0)
 
+        for player in [GameSymbol.X, GameSymbol.O]:
+            self.rolling_wins[player].append(self._rolling_count(self.wins[player], self.rolling_wins[player]))
+        self.rolling_ties.append(self._rolling_count(self.ties, self.rolling_ties))
+
     def update_statistics_on_move(self, game: TicTacToe) -> None:
         """Update rolling win statistics based on the move of a game."""
 
@@ -42,22 +58,22 @@ class RollingWinTracker(StatisticsTracker):
         """Generate and optionally save or display rolling win statistics plots."""
         plt.figure(figsize=figsize)
 
-        players = [GameSymbol.X, GameSymbol.O]
-        total_games_x_axis = range(1, self.total_games + 1)
-
-        # Plot rolling wins for each player
-        for player in players:
-            rolling_wins = [sum(self.wins[player][max(0, i - self.window_size) : i]) for i in range(1, self.total_games + 1)]
-            plt.plot(total_games_x_axis, rolling_wins, label=f"{player.value} Rolling Wins")
-
-        # Plot rolling ties
-        rolling_ties = [sum(self.ties[max(0, i - self.window_size) : i]) for i in range(1, self.total_games + 1)]
-        plt.plot(total_games_x_axis, rolling_ties, label="Rolling Ties")
+        for player in [GameSymbol.X, GameSymbol.O]:
+            self._plot_series(self.rolling_wins[player], f"{player.value} Rolling Wins", first_x=1)
+        self._plot_series(self.rolling_ties, "Rolling Ties", first_x=1)
 
         plt.xlabel("Total Games")
         plt.ylabel(f"Number of Wins/Ties in Last {self.window_size} Games")
         plt.title(f"Rolling Win Stats (Window Size: {self.window_size} Games)")
         plt.legend()
 
-        filename = directory / "rolling_win_stats.png" if directory is None else None
+        filename = directory / "rolling_win_stats.png" if directory else None
         self._display_plot(filename, display)
+
+    def _rolling_count(self, outcomes: list, rolling_counts: list) -> int:
+        """Returns the number of ones within the window, updated with the latest outcome."""
+        count = rolling_counts[-1] if rolling_counts else 0
+        count += outcomes[-1]
+        if len(outcomes) > self.window_size:
+            count -= outcomes[-self.window_size - 1]
+        return count
@@ -11,11 +11,11 @@ from library.statistics import RollingWinTracker
 class RollingWinRateTracker(RollingWinTracker):
     """Tracks rolling win rate statistics for Tic-Tac-Toe games within a specified window size."""
 
-    def __init__(self, window_size: int) -> None:
-        """Initialize a RollingWinRateTracker object with a specified window size."""
-        super().__init__(window_size)
-        self.rolling_winrates = {GameSymbol.X: [], GameSymbol.O: []}
-        self.rolling_tierates = []
+    def __init__(self, window_size: int, retention: Optional[int] = None) -> None:
+        """Initialize a RollingWinRateTracker object with a specified window size, downsampling older games if given a retention."""
+        super().__init__(window_size, retention)
+        self.rolling_winrates = {GameSymbol.X: self._new_series(), GameSymbol.O: self._new_series()}
+        self.rolling_tierates = self._new_series()
 
     def update_statistics_on_win(self, winner: GameSymbol) -> None:
         """Update rolling win rate statistics based on the winner of a game."""
@@ -32,10 +32,9 @@ class RollingWinRateTracker(RollingWinTracker):
         """Generate and optionally save or display rolling win rate statistics plots."""
         plt.figure(figsize=figsize)
 
-        total_games_x_axis = range(1, self.total_games + 1)
         for player in [GameSymbol.X, GameSymbol.O]:
-            plt.plot(total_games_x_axis, self.rolling_winrates[player], label=f"{player.value} Rolling Win Rate")
-        plt.plot(total_games_x_axis, self.rolling_tierates, label="Rolling Tie Rate")
+            self._plot_series(self.rolling_winrates[player], f"{player.value} Rolling Win Rate", first_x=1)
+        self._plot_series(self.rolling_tierates, "Rolling Tie Rate", first_x=1)
 
         plt.legend()
         plt.xlabel("Total Games")
@@ -46,20 +45,18 @@ class RollingWinRateTracker(RollingWinTracker):
         filename = directory / "rolling_win_rate_stats.png" if directory else None
         self._display_plot(filename, display)
 
+    def series(self) -> dict[str, list[float]]:
+        """Returns the per-game rolling win and tie rates, keyed by line label."""
+        return {
+            f"{GameSymbol.X.value} Rolling Win Rate": self.rolling_winrates[GameSymbol.X],
+            f"{GameSymbol.O.value} Rolling Win Rate": self.rolling_winrates[GameSymbol.O],
+            "Rolling Tie Rate": self.rolling_tierates,
+        }
+
     def calculate_rolling_win_rate(self, player: GameSymbol) -> float:
         """Return the rolling win rate for the specified player."""
-        if self.total_games < self.window_size:
-            rolling_wins = sum(self.wins[player])
-            return rolling_wins / self.total_games
-
-        rolling_wins = sum(self.wins[player][-self.window_size :])
-        return rolling_wins / self.window_size
+        return self.rolling_wins[player][-1] / min(self.total_games, self.window_size)
 
     def calculate_rolling_tie_rate(self) -> float:
         """Return the rolling tie rate."""
-        if self.total_games < self.window_size:
-            rolling_ties = sum(self.ties)
-            return rolling_ties / self.total_games
-
-        rolling_ties = sum(self.ties[-self.window_size :])
-        return rolling_ties / self.window_size
+        return self.rolling_ties[-1] / min(self.total_games, self.window_size)
@@ -1,14 +1,16 @@
 """Statistics tracker module."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 import matplotlib as mpl
 from matplotlib import pyplot as plt
 
 from library.controller import GameSubscriber
 from library.model import GameStatus, GameSymbol, TicTacToe
+from library.statistics.downsampled_series import DownsampledSeries
 
 
 class StatisticsTracker(GameSubscriber, ABC):
@@ -16,11 +18,16 @@ class StatisticsTracker(GameSubscriber, ABC):
 
     Attributes:
         total_games: The total number of games played.
+        file_formats: The image formats plots are saved in.
+        retention: Number of recent values kept at full resolution by trackers storing per-game series, with older
+            values downsampled, or None to keep every value.
     """
 
     def __init__(self) -> None:
         """Initialize a StatisticsTracker object."""
         self.total_games: int = 0
+        self.file_formats: tuple[str, ...] = ("png",)
+        self.retention: Optional[int] = None
 
     @abstractmethod
     def update_statistics_on_win(self, winner: GameSymbol) -> None:
@@ -34,13 +41,39 @@ class StatisticsTracker(GameSubscriber, ABC):
     def plot_statistics(self, directory: Optional[Path] = None, display: bool = False, figsize: tuple = (8, 6)) -> None:
         """Generate and optionally save or display statistics plots."""
 
+    def series(self) -> dict[str, list[float]]:
+        """Returns the per-game time series plotted by this tracker, keyed by line label."""
+        return {}
+
+    def _new_series(self, recent: int = 1) -> Union[list, DownsampledSeries]:
+        """Returns an empty per-game series, downsampled if the tracker has a retention limit.
+
+        Args:
+            recent: Number of recent values the tracker itself needs at full resolution.
+        """
+        if self.retention is None:
+            return []
+        return DownsampledSeries(max(self.retention, recent))
+
+    def _plot_series(self, values: Sequence[float], label: str, first_x: int = 0) -> None:
+        """Plot a per-game series, shading the range of the values merged into each point of a downsampled series."""
+        if isinstance(values, DownsampledSeries):
+            starts, counts, minimums, means, maximums = values.buckets()
+            x_axis = first_x + starts + (counts - 1) / 2
+            (line,) = plt.plot(x_axis, means, label=label)
+            plt.fill_between(x_axis, minimums, maximums, color=line.get_color(), alpha=0.25, linewidth=0)
+        else:
+            plt.plot(range(first_x, first_x + len(values)), values, label=label)
+
     def _display_plot(self, filename: Optional[Path] = None, display: bool = False) -> None:
-        """Display or save the plot based on the filename and display flag."""
+        """Display or save the plot based on the filename and display flag, then close it."""
         if filename:
             filename.parent.mkdir(parents=True, exist_ok=True)
-            plt.savefig(filename)
+            for file_format in self.file_formats:
+                plt.savefig(filename.with_suffix(f".{file_format}"))
         if display:
             plt.show()
+        plt.close()
 
     def notify(self, game: TicTacToe) -> None:
         """Checks for game notifications and updates statistics upon game end."""
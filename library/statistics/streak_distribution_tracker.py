@@ -0,0 +1,61 @@
+"""StreakDistributionTracker module."""
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from matplotlib import pyplot as plt
+
+from library.model import GameSymbol, TicTacToe
+from library.statistics import StatisticsTracker
+from library.statistics.streaming_sketch import CountHistogram
+
+
+class StreakDistributionTracker(StatisticsTracker):
+    """Tracks the distribution of win streak lengths of each player in constant memory.
+
+    A streak is counted once it ends, by a loss or a tie, so the current streaks are not part of the histograms yet.
+
+    Attributes:
+        max_streak: Streaks of this length or longer share the last bin of the histograms.
+        histograms: Per player, the number of ended streaks of every length.
+        current_streaks: Per player, the length of the current streak.
+    """
+
+    def __init__(self, max_streak: int = 50) -> None:
+        """Initialize a StreakDistributionTracker object."""
+        super().__init__()
+        self.max_streak = max_streak
+        self.histograms = {GameSymbol.X: CountHistogram(max_streak + 1), GameSymbol.O: CountHistogram(max_streak + 1)}
+        self.current_streaks = {GameSymbol.X: 0, GameSymbol.O: 0}
+
+    def update_statistics_on_win(self, winner: GameSymbol) -> None:
+        """Extend the winner's streak and end the other streaks."""
+        for player in [GameSymbol.X, GameSymbol.O]:
+            if player == winner:
+                self.current_streaks[player] += 1
+            elif self.current_streaks[player] > 0:
+                self.histograms[player].add(self.current_streaks[player])
+                self.current_streaks[player] = 0
+
+    def update_statistics_on_move(self, game: TicTacToe) -> None:
+        """Update streak statistics based on the move of a game."""
+
+    def plot_statistics(self, directory: Optional[Path] = None, display: bool = False, figsize: tuple = (8, 6)) -> None:
+        """Generate and optionally save or display the streak length distribution plot."""
+        plt.figure(figsize=figsize)
+
+        lengths = np.arange(1, self.max_streak + 1)
+        width = 0.4
+        for offset, player in zip([-width / 2, width / 2], [GameSymbol.X, GameSymbol.O]):
+            histogram = self.histograms[player]
+            label = f"{player.value} (p50: {histogram.quantile(0.5)}, p99: {histogram.quantile(0.99)})"
+            plt.bar(lengths + offset, histogram.counts[1:], width, label=label)
+
+        plt.xlabel(f"Streak Length (last bin: {self.max_streak} or more)")
+        plt.ylabel("Number of Streaks")
+        plt.yscale("symlog")
+        plt.title("Win Streak Distribution")
+        plt.legend()
+
+        filename = directory / "streak_distribution.png" if directory else None
+        self._display_plot(filename, display)
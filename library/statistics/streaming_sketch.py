@@ -0,0 +1,93 @@
+"""Streaming sketch module.
+
+Fixed-size summaries of a stream of values, so the distribution of a statistic can be reported over arbitrarily long
+runs without keeping the values themselves.
+"""
+import math
+
+import numpy as np
+
+
+class CountHistogram:
+    """Exact histogram of non-negative integers below a limit, with one overflow bin for all larger values.
+
+    Attributes:
+        counts: The number of values equal to each bin index, the last bin counting every value >= its index.
+        total: The number of values added.
+    """
+
+    def __init__(self, num_bins: int) -> None:
+        """Initialize an empty CountHistogram with bins for the values 0 to num_bins - 2 and an overflow bin."""
+        if num_bins < 2:
+            raise ValueError(f"A histogram needs at least 2 bins, got {num_bins}.")
+        self.counts = np.zeros(num_bins, dtype=np.int64)
+        self.total = 0
+
+    def add(self, value: int) -> None:
+        """Add a value to the histogram."""
+        self.counts[min(value, len(self.counts) - 1)] += 1
+        self.total += 1
+
+    def quantile(self, q: float) -> int:
+        """Returns the smallest value at least a fraction q of all values are less than or equal to.
+
+        Values in the overflow bin are reported as the overflow bin's index.
+        """
+        if self.total == 0:
+            return 0
+        return int(np.searchsorted(np.cumsum(self.counts), q * self.total))
+
+    def mean(self) -> float:
+        """Returns the mean of the values, counting overflowed values as the overflow bin's index."""
+        if self.total == 0:
+            return 0.0
+        return float(np.dot(np.arange(len(self.counts)), self.counts) / self.total)
+
+
+class QuantileSketch:
+    """Approximate quantiles of positive values, from counts in logarithmically sized buckets.
+
+    Every bucket covers values within a factor of (1 + accuracy) / (1 - accuracy), so every quantile is reported within
+    the given relative accuracy of a value in the stream. Values outside [min_value, max_value] are clamped to it, which
+    fixes the number of buckets.
+
+    Attributes:
+        accuracy: Relative accuracy of the reported quantiles.
+        min_value: Smallest value that is told apart from smaller values.
+        max_value: Largest value that is told apart from larger values.
+        counts: The number of values in every bucket.
+        total: The number of values added.
+    """
+
+    def __init__(self, accuracy: float = 0.01, min_value: float = 1e-7, max_value: float = 1e3) -> None:
+        """Initialize an empty QuantileSketch."""
+        if not 0 < accuracy < 1:
+            raise ValueError(f"Accuracy must be in (0, 1), got {accuracy}.")
+
+        self.accuracy = accuracy
+        self.min_value = min_value
+        self.max_value = max_value
+        self._gamma = (1 + accuracy) / (1 - accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._offset = math.ceil(math.log(min_value) / self._log_gamma)
+        self.counts = np.zeros(self._bucket(max_value) + 1, dtype=np.int64)
+        self.total = 0
+
+    def add(self, value: float) -> None:
+        """Add a value to the sketch."""
+        self.counts[self._bucket(value)] += 1
+        self.total += 1
+
+    def quantile(self, q: float) -> float:
+        """Returns an approximation of the value at least a fraction q of all values are less than or equal to."""
+        if self.total == 0:
+            return 0.0
+
+        bucket = int(np.searchsorted(np.cumsum(self.counts), q * self.total))
+        # The bucket covers (gamma^(i-1), gamma^i]; this value is within the accuracy of both ends
+        return 2 * self._gamma ** (bucket + self._offset) / (self._gamma + 1)
+
+    def _bucket(self, value: float) -> int:
+        """Returns the index of the bucket a value is counted in."""
+        value = min(max(value, self.min_value), self.max_value)
+        return math.ceil(math.log(value) / self._log_gamma) - self._offset
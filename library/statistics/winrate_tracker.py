@@ -16,11 +16,12 @@ class WinRateTracker(WinTracker):
         tierates: A list that keeps track of the tie rate for each game.
     """
 
-    def __init__(self) -> None:
-        """Initialize a WinRateTracker object."""
+    def __init__(self, retention: Optional[int] = None) -> None:
+        """Initialize a WinRateTracker object, downsampling all but the last `retention` rates if given."""
         super().__init__()
-        self.winrates = {GameSymbol.X: [], GameSymbol.O: []}
-        self.tierates = []
+        self.retention = retention
+        self.winrates = {GameSymbol.X: self._new_series(), GameSymbol.O: self._new_series()}
+        self.tierates = self._new_series()
 
     def update_statistics_on_win(self, winner: GameSymbol) -> None:
         """Update win rate statistics based on the winner of a game."""
@@ -37,9 +38,9 @@ class WinRateTracker(WinTracker):
         """Generate and optionally save or display win rate statistics plots."""
         plt.figure(figsize=figsize)
 
-        plt.plot(self.winrates[GameSymbol.X], label="X Win Rate")
-        plt.plot(self.winrates[GameSymbol.O], label="O Win Rate")
-        plt.plot(self.tierates, label="Tie Rate")
+        self._plot_series(self.winrates[GameSymbol.X], "X Win Rate")
+        self._plot_series(self.winrates[GameSymbol.O], "O Win Rate")
+        self._plot_series(self.tierates, "Tie Rate")
 
         plt.legend()
         plt.xlabel("Games Played")
@@ -50,6 +51,14 @@ class WinRateTracker(WinTracker):
         filename = directory / "win_rate_stats.png" if directory else None
         self._display_plot(filename, display)
 
+    def series(self) -> dict[str, list[float]]:
+        """Returns the per-game win and tie rates, keyed by line label."""
+        return {
+            "X Win Rate": self.winrates[GameSymbol.X],
+            "O Win Rate": self.winrates[GameSymbol.O],
+            "Tie Rate": self.tierates,
+        }
+
     def calculate_win_rate(self, player: GameSymbol) -> float:
         """Return the win rate for the specified player."""
         wins = self.wins[player]
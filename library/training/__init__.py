@@ -0,0 +1,9 @@
+"""Initializes the training package, importing utilities for running and tuning training runs."""
+
+from .convergence_stopping_policy import ConvergenceStoppingPolicy
+
+from .replay_buffer import ReplayBuffer, TrajectoryRecorder
+from .offline_trainer import OfflineTrainer
+from .parallel_trainer import MergeStrategy, ParallelTrainer
+from .hyperparameter_sweep import HyperparameterSweep, grid_configurations, random_configurations
+from .run_cache import RunCache
@@ -0,0 +1,110 @@
+"""ConvergenceStoppingPolicy module."""
+from collections import deque
+from typing import Optional
+
+from library.controller import StoppingPolicy
+from library.model import GameSymbol
+from library.statistics import GameLengthTracker, RollingWinRateTracker
+
+
+class ConvergenceStoppingPolicy(StoppingPolicy):
+    """Stops a run once the rolling statistics have converged or a target win rate is reached.
+
+    The rolling win and tie rates (and optionally the rolling game length) are considered stable once every value
+    over the last `horizon` games lies within the tolerance of each other.
+
+    Attributes:
+        winrate_tracker: The tracker providing rolling win and tie rates.
+        length_tracker: Optional tracker providing the rolling average game length.
+        tolerance: Maximum spread of the rolling rates over the horizon, or None to disable the stability check.
+        length_tolerance: Maximum spread of the rolling average game length over the horizon.
+        horizon: Number of consecutive games the statistics have to stay within tolerance.
+        target_rate: Rolling win rate of the target player at which to stop, or None to disable the target check.
+        target_player: The player whose rolling win rate is compared against the target rate.
+        min_games: Number of games to play before the policy may stop the run.
+        stop_reason: Description of why the policy stopped the run, or None if it has not stopped it.
+    """
+
+    def __init__(
+        self,
+        winrate_tracker: RollingWinRateTracker,
+        tolerance: Optional[float] = 0.01,
+        horizon: int = 500,
+        target_rate: Optional[float] = None,
+        target_player: GameSymbol = GameSymbol.O,
+        length_tracker: Optional[GameLengthTracker] = None,
+        length_tolerance: float = 0.1,
+        min_games: Optional[int] = None,
+    ) -> None:
+        """Initialize a ConvergenceStoppingPolicy object.
+
+        Args:
+            winrate_tracker: The tracker providing rolling win and tie rates.
+            tolerance: Maximum spread of the rolling rates over the horizon, or None to disable the stability check.
+            horizon: Number of consecutive games the statistics have to stay within tolerance.
+            target_rate: Rolling win rate of the target player at which to stop, or None to disable the target check.
+            target_player: The player whose rolling win rate is compared against the target rate.
+            length_tracker: Optional tracker providing the rolling average game length.
+            length_tolerance: Maximum spread of the rolling average game length over the horizon.
+            min_games: Number of games to play before stopping is allowed (default: the tracker's window size).
+        """
+        if horizon < 1:
+            raise ValueError(f"Horizon must be positive, got {horizon}.")
+
+        self.winrate_tracker = winrate_tracker
+        self.length_tracker = length_tracker
+        self.tolerance = tolerance
+        self.length_tolerance = length_tolerance
+        self.horizon = horizon
+        self.target_rate = target_rate
+        self.target_player = target_player
+        self.min_games = winrate_tracker.window_size if min_games is None else min_games
+        self.stop_reason: Optional[str] = None
+
+        self._games_seen = 0
+        self._rates: dict[str, deque[float]] = {label: deque(maxlen=horizon) for label in ["X", "O", "Tie"]}
+        self._lengths: deque[float] = deque(maxlen=horizon)
+
+    def should_stop(self) -> bool:
+        """Returns True once the rolling statistics are stable or the target win rate has been reached."""
+        total_games = self.winrate_tracker.total_games
+        if total_games == 0:
+            return False
+        if total_games != self._games_seen:
+            self._games_seen = total_games
+            self._record_latest()
+
+        if total_games < self.min_games:
+            return False
+
+        if self.target_rate is not None:
+            rate = self.winrate_tracker.rolling_winrates[self.target_player][-1]
+            if rate >= self.target_rate:
+                self.stop_reason = f"{self.target_player.value} reached a rolling win rate of {rate:.3f} (target {self.target_rate:.3f})"
+                return True
+
+        if self.tolerance is not None and self._is_stable():
+            self.stop_reason = f"Rolling statistics stayed within tolerance {self.tolerance} for {self.horizon} games"
+            return True
+
+        return False
+
+    def _record_latest(self) -> None:
+        """Record the latest rolling statistics of the trackers."""
+        self._rates["X"].append(self.winrate_tracker.rolling_winrates[GameSymbol.X][-1])
+        self._rates["O"].append(self.winrate_tracker.rolling_winrates[GameSymbol.O][-1])
+        self._rates["Tie"].append(self.winrate_tracker.rolling_tierates[-1])
+        if self.length_tracker is not None and self.length_tracker.average_game_lengths:
+            self._lengths.append(self.length_tracker.average_game_lengths[-1])
+
+    def _is_stable(self) -> bool:
+        """Returns True if every recorded statistic spans a full horizon within its tolerance."""
+        for rates in self._rates.values():
+            if len(rates) < self.horizon or max(rates) - min(rates) > self.tolerance:
+                return False
+
+        if self.length_tracker is not None:
+            if len(self._lengths) < self.horizon or max(self._lengths) - min(self._lengths) > self.length_tolerance:
+                return False
+
+        return True
@@ -0,0 +1,181 @@
+"""Hyperparameter sweep module."""
+import itertools
+import json
+import multiprocessing
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from library.agent import MatchboxAgent, RandomAgent, RandomStream
+from library.controller import GameController, GamePublisher
+from library.model import GameSymbol, TicTacToe
+from library.statistics import RollingWinRateTracker
+from library.training.convergence_stopping_policy import ConvergenceStoppingPolicy
+
+# The LearningConfig settings exposed by MatchboxAgent.from_board_size
+PARAMETERS = ("start_beads", "max_beads", "win_reward", "draw_reward", "lose_punishment")
+
+
+def grid_configurations(space: dict[str, Sequence[int]]) -> list[dict[str, int]]:
+    """Returns every combination of the values in a search space, keyed by parameter name."""
+    _check_parameters(space)
+    return [dict(zip(space, values)) for values in itertools.product(*space.values())]
+
+
+def random_configurations(space: dict[str, Sequence[int]], num_samples: int, seed: Optional[int] = None) -> list[dict[str, int]]:
+    """Returns distinct configurations drawn uniformly from the values in a search space.
+
+    At most every combination of the search space is returned, so asking for more samples than combinations returns the
+    full grid in random order.
+    """
+    _check_parameters(space)
+    num_samples = min(num_samples, int(np.prod([len(values) for values in space.values()])))
+    stream = RandomStream(seed)
+    configurations: dict[tuple[int, ...], dict[str, int]] = {}
+    while len(configurations) < num_samples:
+        configuration = {name: values[stream.index(len(values))] for name, values in space.items()}
+        configurations.setdefault(tuple(configuration.values()), configuration)
+    return list(configurations.values())
+
+
+class HyperparameterSweep:
+    """Evaluates MatchboxAgent learning configurations against a random opponent in a process pool.
+
+    Every configuration is trained once per seed, each trial in its own worker process. A trial plays until the rolling
+    rates have converged or `num_games` have been played, and records the agent's final rolling win rate and the number
+    of games played. Trials are appended to a JSON Lines file as they finish, and trials already in the file are
+    skipped, so an interrupted sweep resumes where it stopped when run again with the same file.
+
+    Attributes:
+        results_path: The JSON Lines file the trial results are saved to.
+        num_games: Maximum number of games per trial.
+        num_seeds: Number of seeds every configuration is trained with.
+        symbol: The symbol the agent plays as.
+        board_size: Size of the board.
+        window_size: Window size of the rolling win rates.
+        tolerance: Spread of the rolling rates over the horizon at which a trial counts as converged.
+        horizon: Number of games the rolling rates must stay within tolerance.
+        max_workers: Maximum number of worker processes (default: one per CPU).
+    """
+
+    def __init__(
+        self,
+        results_path: Path,
+        num_games: int = 5000,
+        num_seeds: int = 3,
+        symbol: GameSymbol = GameSymbol.O,
+        board_size: int = 3,
+        window_size: int = 250,
+        tolerance: float = 0.02,
+        horizon: int = 500,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """Initialize a HyperparameterSweep."""
+        self.results_path = Path(results_path)
+        self.num_games = num_games
+        self.num_seeds = num_seeds
+        self.symbol = symbol
+        self.board_size = board_size
+        self.window_size = window_size
+        self.tolerance = tolerance
+        self.horizon = horizon
+        self.max_workers = max_workers
+
+    def run(self, configurations: list[dict[str, int]]) -> list[dict]:
+        """Run every trial of the configurations that is not yet in the results file.
+
+        Args:
+            configurations: The configurations to evaluate, as returned by `grid_configurations` or
+                `random_configurations`.
+
+        Returns:
+            The ranking of all configurations in the results file, as returned by `ranking`.
+        """
+        finished = {(_config_key(result["config"]), result["seed"]) for result in self.load_results()}
+        trials = [
+            (configuration, seed)
+            for configuration in configurations
+            for seed in range(self.num_seeds)
+            if (_config_key(configuration), seed) not in finished
+        ]
+
+        if trials:
+            self.results_path.parent.mkdir(parents=True, exist_ok=True)
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(self.max_workers, mp_context=context) as executor, open(self.results_path, "a", encoding="utf-8") as file:
+                futures = [executor.submit(self._run_trial, configuration, seed) for configuration, seed in trials]
+                for future in as_completed(futures):
+                    file.write(json.dumps(future.result()) + "\n")
+                    file.flush()
+
+        return self.ranking()
+
+    def load_results(self) -> list[dict]:
+        """Returns the results of all finished trials in the results file."""
+        if not self.results_path.exists():
+            return []
+        with open(self.results_path, encoding="utf-8") as file:
+            return [json.loads(line) for line in file if line.strip()]
+
+    def ranking(self) -> list[dict]:
+        """Returns the configurations in the results file, best first.
+
+        Configurations are ranked by their final rolling win rate averaged over all seeds, with ties broken by the
+        average number of games until convergence. Trials that did not converge count as `num_games`.
+        """
+        trials: dict[tuple[int, ...], list[dict]] = {}
+        for result in self.load_results():
+            trials.setdefault(_config_key(result["config"]), []).append(result)
+
+        ranking = [
+            {
+                "config": results[0]["config"],
+                "win_rate": float(np.mean([result["win_rate"] for result in results])),
+                "win_rate_std": float(np.std([result["win_rate"] for result in results])),
+                "games_to_converge": float(np.mean([result["games_played"] for result in results])),
+                "converged": sum(result["converged"] for result in results),
+                "seeds": len(results),
+            }
+            for results in trials.values()
+        ]
+        return sorted(ranking, key=lambda entry: (-entry["win_rate"], entry["games_to_converge"]))
+
+    def _run_trial(self, configuration: dict[str, int], seed: int) -> dict:
+        """Train an agent with one configuration and seed, and return the result."""
+        agent_stream, opponent_stream = RandomStream(seed).spawn(2)
+        agent = MatchboxAgent.from_board_size(self.symbol, self.board_size, random_stream=agent_stream, **configuration)
+        players = {self.symbol: agent, self.symbol.other(): RandomAgent(self.symbol.other(), opponent_stream)}
+
+        tracker = RollingWinRateTracker(self.window_size)
+        publisher = GamePublisher()
+        publisher.add_subscriber(tracker)
+        stopping_policy = ConvergenceStoppingPolicy(tracker, self.tolerance, self.horizon)
+
+        controller = GameController(TicTacToe.from_board_size(self.board_size), players, publisher, stopping_policy, move_delay=0)
+        games_played = controller.play_games(self.num_games)
+        return {
+            "config": configuration,
+            "seed": seed,
+            "win_rate": tracker.rolling_winrates[self.symbol][-1],
+            "tie_rate": tracker.rolling_tierates[-1],
+            "games_played": games_played,
+            "converged": stopping_policy.stop_reason is not None,
+        }
+
+
+def _check_parameters(space: dict[str, Sequence[int]]) -> None:
+    """Raise a ValueError for search space parameters MatchboxAgent does not take, or with repeated values."""
+    unknown = set(space) - set(PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown parameters {sorted(unknown)}, expected a subset of {PARAMETERS}.")
+    for name, values in space.items():
+        if len(set(values)) != len(values):
+            raise ValueError(f"Values of {name} must be distinct, got {list(values)}.")
+
+
+def _config_key(configuration: dict[str, int]) -> tuple[int, ...]:
+    """Returns a hashable key identifying a configuration."""
+    return tuple(configuration.get(name) for name in PARAMETERS)
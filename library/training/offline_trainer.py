@@ -0,0 +1,59 @@
+"""OfflineTrainer module."""
+import numpy as np
+from matchbox import Matchbox
+
+from library.agent import MatchboxAgent
+from library.training.replay_buffer import LOSS, ReplayBuffer
+
+
+class OfflineTrainer:
+    """Trains a MatchboxAgent in bulk from the trajectories stored in a ReplayBuffer.
+
+    All bead changes for the same state and action are summed and applied with a single update, so a buffer of millions
+    of moves costs one update per distinct state-action pair. The result matches replaying the games one by one as long
+    as no bead count hits zero or `max_beads` along the way.
+    """
+
+    def train(self, agent: MatchboxAgent, buffer: ReplayBuffer) -> int:
+        """Apply the bead updates for every move the agent's symbol made in the buffer.
+
+        Args:
+            agent: The agent to train.
+            buffer: The recorded trajectories.
+
+        Returns:
+            The number of moves the agent was trained on.
+        """
+        rows = buffer.transitions
+        rows = rows[rows["player"] == agent.symbol.value.encode()]
+        if len(rows) == 0:
+            return 0
+
+        engine = agent.engine
+        config = engine.config
+        # Indexed by outcome - LOSS, i.e. [loss, draw, win]
+        rewards = np.array([-config.lose_punishment, config.draw_reward, config.win_reward])
+        changes = rewards[rows["outcome"] - LOSS]
+
+        states, state_indexes = np.unique(rows["state"], return_inverse=True)
+        num_cells = buffer.board_size**2
+        pairs, pair_indexes = np.unique(state_indexes * num_cells + rows["action"], return_inverse=True)
+        pair_changes = np.bincount(pair_indexes, weights=changes).astype(int)
+
+        # Raw states that are rotations or reflections of each other may share a matchbox
+        matchbox_changes: dict[tuple[str, int], int] = {}
+        for pair, change in zip(pairs.tolist(), pair_changes.tolist()):
+            state_index, action = divmod(pair, num_cells)
+            state_key, cells = agent.normalize_state(states[state_index].decode())
+            key = (state_key, cells.index(action))
+            matchbox_changes[key] = matchbox_changes.get(key, 0) + change
+
+        beads = {bead.action: bead for bead in engine.available_beads}
+        for (state_key, action), change in matchbox_changes.items():
+            if change == 0:
+                continue
+            if state_key not in engine.boxes:
+                engine.boxes[state_key] = Matchbox(state_key, {bead: config.initial_beads for bead in engine.available_beads})
+            engine.boxes[state_key].update(beads[action], change, config.max_beads)
+
+        return len(rows)
@@ -0,0 +1,243 @@
+"""Parallel trainer module."""
+import itertools
+import math
+import multiprocessing
+from collections.abc import Callable
+from enum import Enum
+from multiprocessing.connection import Connection
+from multiprocessing.context import SpawnContext, SpawnProcess
+from typing import Optional
+
+import numpy as np
+
+from library.agent import Agent, MatchboxAgent, RandomAgent, RandomStream
+from library.controller import GameController, GamePublisher
+from library.model import GameSymbol, TicTacToe
+
+
+class MergeStrategy(Enum):
+    """How the bead changes of the workers are combined into the central policy."""
+
+    SUM = "sum"
+    MEAN = "mean"
+
+
+class ParallelTrainer:
+    """Trains a MatchboxAgent with several worker processes that each play against their own opponent.
+
+    Training runs in rounds. The workers start from a copy of the agent's bead counts and keep their copy between rounds.
+    Every round, each worker plays its share of the round's games and sends back only the bead changes it made. The
+    changes are merged into the agent, summed or averaged and clamped to [0, max_beads], and the merged counts of the
+    changed matchboxes are sent back to the workers at the start of the next round, so the workers' copies again equal
+    the agent's.
+
+    Summing applies every game's update, as if one process had played all games of the round against the same
+    policy. Averaging takes smaller, steadier steps. Shorter rounds keep the workers' copies closer to the central policy
+    at the cost of more merges.
+
+    The workers only play at the same time with a CPU per worker. Starting the workers and merging the rounds has a
+    cost, so with a single CPU training one agent in the main process is faster.
+
+    Attributes:
+        num_workers: Number of worker processes.
+        games_per_round: Number of games played by all workers together between merges.
+        merge_strategy: How the workers' bead changes are combined.
+        opponent: Creates the opponent of each worker from its symbol and random stream.
+        round_results: The number of games won by each symbol in every round, with ties counted under NONE.
+    """
+
+    def __init__(
+        self,
+        num_workers: Optional[int] = None,
+        games_per_round: int = 5000,
+        merge_strategy: MergeStrategy = MergeStrategy.SUM,
+        opponent: Callable[[GameSymbol, RandomStream], Agent] = RandomAgent,
+    ) -> None:
+        """Initialize a ParallelTrainer (default: one worker per CPU)."""
+        self.num_workers = num_workers or multiprocessing.cpu_count()
+        self.games_per_round = games_per_round
+        self.merge_strategy = merge_strategy
+        self.opponent = opponent
+        self.round_results: list[dict[GameSymbol, int]] = []
+
+    def train(self, agent: MatchboxAgent, num_games: int) -> int:
+        """Train the agent on a number of games played by the workers.
+
+        Args:
+            agent: The agent to train. The merged bead counts are written to it after every round.
+            num_games: The number of games to play.
+
+        Returns:
+            The number of games played.
+        """
+        if self.num_workers == 1:
+            return self._train_in_process(agent, num_games)
+
+        context = multiprocessing.get_context("spawn")
+        streams = agent.random_stream.spawn(2 * self.num_workers)
+        processes, connections = [], []
+        try:
+            for agent_stream, opponent_stream in zip(streams[::2], streams[1::2]):
+                process, connection = self._start_worker(context, agent, agent_stream, opponent_stream)
+                processes.append(process)
+                connections.append(connection)
+
+            # The first round hands the workers the whole table, later rounds only the matchboxes that changed
+            updates = agent.bead_table()
+            games_played = 0
+            while games_played < num_games:
+                round_games = min(self.games_per_round, num_games - games_played)
+                updates = self._train_round(connections, agent, updates, round_games)
+                games_played += round_games
+        finally:
+            # Closing the connections stops the workers
+            for connection in connections:
+                connection.close()
+            for process in processes:
+                process.join()
+        return games_played
+
+    def _train_in_process(self, agent: MatchboxAgent, num_games: int) -> int:
+        """Train the agent itself in rounds, as a single worker process would only add the cost of starting it."""
+        opponent = self.opponent(agent.symbol.other(), agent.random_stream.spawn(1)[0])
+        controller = _create_controller(agent, opponent)
+        games_played = 0
+        while games_played < num_games:
+            round_games = min(self.games_per_round, num_games - games_played)
+            self.round_results.append(_count_wins(controller, round_games))
+            games_played += round_games
+        return games_played
+
+    def _start_worker(
+        self,
+        context: SpawnContext,
+        agent: MatchboxAgent,
+        agent_stream: RandomStream,
+        opponent_stream: RandomStream,
+    ) -> tuple[SpawnProcess, Connection]:
+        """Start a worker process with an empty copy of the agent and its own opponent.
+
+        Returns:
+            The worker process, and the trainer's end of its connection.
+        """
+        connection, worker_connection = context.Pipe()
+        worker = agent.empty_copy(agent_stream)
+        opponent = self.opponent(agent.symbol.other(), opponent_stream)
+        process = context.Process(target=_run_worker, args=(worker_connection, worker, opponent), daemon=True)
+        process.start()
+        # Only the worker keeps its end open, so the worker sees the connection close when the trainer closes its end
+        worker_connection.close()
+        return process, connection
+
+    def _train_round(
+        self,
+        connections: list[Connection],
+        agent: MatchboxAgent,
+        updates: dict[str, tuple[int, ...]],
+        num_games: int,
+    ) -> dict[str, tuple[int, ...]]:
+        """Play one round of games on the workers and merge their bead changes into the agent.
+
+        Returns:
+            The merged bead counts of every matchbox a worker changed.
+        """
+        counts = [num_games // self.num_workers + (i < num_games % self.num_workers) for i in range(self.num_workers)]
+        for connection, count in zip(connections, counts):
+            connection.send((updates, count))
+
+        results = []
+        for connection, count in zip(connections, counts):
+            result = connection.recv()
+            if isinstance(result, Exception):
+                raise result
+            if count > 0:
+                results.append(result)
+
+        merged = self._merge(agent, [changes for changes, _ in results])
+        agent.update_bead_table(merged)
+
+        round_results = {GameSymbol.X: 0, GameSymbol.O: 0, GameSymbol.NONE: 0}
+        for _, wins in results:
+            for symbol, count in wins.items():
+                round_results[symbol] += count
+        self.round_results.append(round_results)
+        return merged
+
+    def _merge(self, agent: MatchboxAgent, worker_changes: list[dict[str, tuple[int, ...]]]) -> dict[str, tuple[int, ...]]:
+        """Returns the agent's bead counts with the changes of all workers applied, for every matchbox that changed."""
+        states = list(dict.fromkeys(itertools.chain(*worker_changes)))
+        if not states:
+            return {}
+
+        config = agent.engine.config
+        num_beads = len(agent.engine.available_beads)
+        initial_counts = (config.initial_beads,) * num_beads
+        table = agent.bead_table()
+
+        base = np.array([table.get(state_id, initial_counts) for state_id in states])
+        changes = np.zeros_like(base)
+        for worker_change in worker_changes:
+            changes += np.array([worker_change.get(state_id, (0,) * num_beads) for state_id in states])
+
+        if self.merge_strategy == MergeStrategy.MEAN:
+            changes = np.rint(changes / len(worker_changes)).astype(int)
+        merged = np.clip(base + changes, 0, config.max_beads)
+        return dict(zip(states, map(tuple, merged.tolist())))
+
+
+def _run_worker(connection: Connection, agent: MatchboxAgent, opponent: Agent) -> None:
+    """Play the rounds the trainer sends to a worker process, until the trainer closes the connection."""
+    controller = _create_controller(agent, opponent)
+    with connection:
+        try:
+            while True:
+                updates, num_games = connection.recv()
+                try:
+                    result = _play_round(agent, controller, updates, num_games)
+                # The trainer re-raises the error, which would otherwise only show up as a closed connection
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    result = error
+                connection.send(result)
+        except (EOFError, ConnectionError):
+            # The trainer closed the connection, after the last round or because another worker failed
+            return
+
+
+def _play_round(
+    agent: MatchboxAgent,
+    controller: GameController,
+    updates: dict[str, tuple[int, ...]],
+    num_games: int,
+) -> tuple[dict[str, tuple[int, ...]], dict[GameSymbol, int]]:
+    """Train a worker copy of the agent for one round, after applying the merged bead counts of the last round.
+
+    Returns:
+        The bead changes of every matchbox the worker changed, and the number of games won by each symbol.
+    """
+    agent.update_bead_table(updates)
+    initial_counts = (agent.engine.config.initial_beads,) * len(agent.engine.available_beads)
+    table = agent.bead_table()
+
+    wins = _count_wins(controller, num_games)
+
+    changes = {}
+    for state_id, counts in agent.bead_table().items():
+        base = table.get(state_id, initial_counts)
+        if counts != base:
+            changes[state_id] = tuple(count - base_count for count, base_count in zip(counts, base))
+    return changes, wins
+
+
+def _create_controller(agent: MatchboxAgent, opponent: Agent) -> GameController:
+    """Returns a controller that plays the agent against the opponent without delay or subscribers."""
+    game = TicTacToe.from_board_size(math.isqrt(len(agent.engine.available_beads)))
+    players = {agent.symbol: agent, opponent.symbol: opponent}
+    return GameController(game, players, GamePublisher(), move_delay=0)
+
+
+def _count_wins(controller: GameController, num_games: int) -> dict[GameSymbol, int]:
+    """Play a number of games, returning the number of games won by each symbol, with ties counted under NONE."""
+    wins = {GameSymbol.X: 0, GameSymbol.O: 0, GameSymbol.NONE: 0}
+    for record in controller.stream_games(num_games):
+        wins[record.winner] += 1
+    return wins
@@ -0,0 +1,162 @@
+"""ReplayBuffer module."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from library.controller import GameSubscriber
+from library.model import GameStatus, GameSymbol, TicTacToe
+
+# Outcome codes stored per move, from the perspective of the player who made the move.
+LOSS = -1
+DRAW = 0
+WIN = 1
+
+
+def trajectory_dtype(board_size: int) -> np.dtype:
+    """Returns the structured dtype of a single recorded move for the given board size.
+
+    Args:
+        board_size: Size of the board (3 for 3x3).
+
+    Returns:
+        A dtype with the game number, the state key before the move, the chosen cell, the moving player and the outcome.
+    """
+    return np.dtype(
+        [
+            ("game", np.uint32),
+            ("state", f"S{board_size**2}"),
+            ("action", np.uint16),
+            ("player", "S1"),
+            ("outcome", np.int8),
+        ]
+    )
+
+
+class ReplayBuffer:
+    """Fixed-capacity buffer of game trajectories stored in a NumPy structured array.
+
+    Each row is one move: the state key before the move (the same key `MatchboxAgent` uses), the chosen cell, the moving
+    player and the final outcome for that player. Once full, the oldest moves are overwritten.
+
+    Attributes:
+        board_size: Size of the board the trajectories were recorded on.
+        capacity: Maximum number of moves held by the buffer.
+        num_games: Number of games added to the buffer so far.
+    """
+
+    def __init__(self, board_size: int = 3, capacity: int = 1_000_000) -> None:
+        """Initialize an empty ReplayBuffer."""
+        if capacity < 1:
+            raise ValueError(f"Capacity must be positive, got {capacity}.")
+
+        self.board_size = board_size
+        self.capacity = capacity
+        self.num_games = 0
+        self._data = np.zeros(capacity, dtype=trajectory_dtype(board_size))
+        self._size = 0
+        self._next = 0
+
+    def add_game(self, states: list[str], actions: list[int], players: list[GameSymbol], winner: GameSymbol) -> None:
+        """Add the trajectory of a finished game.
+
+        Args:
+            states: State keys before each move.
+            actions: Cell chosen at each move.
+            players: Player who made each move.
+            winner: The winning symbol, or NONE for a tie.
+        """
+        rows = np.zeros(len(states), dtype=self._data.dtype)
+        rows["game"] = self.num_games
+        rows["state"] = states
+        rows["action"] = actions
+        rows["player"] = [player.value for player in players]
+        if winner is GameSymbol.NONE:
+            rows["outcome"] = DRAW
+        else:
+            rows["outcome"] = np.where(rows["player"] == winner.value.encode(), WIN, LOSS)
+
+        self._write(rows)
+        self.num_games += 1
+
+    @property
+    def transitions(self) -> np.ndarray:
+        """Returns the recorded moves, oldest first."""
+        if self._size < self.capacity:
+            return self._data[: self._size]
+        return np.concatenate([self._data[self._next :], self._data[: self._next]])
+
+    def save(self, path: Path) -> None:
+        """Save the recorded moves to a `.npy` file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(path, self.transitions)
+
+    def add_transitions(self, rows: np.ndarray) -> None:
+        """Add recorded moves in the format of `transitions`, such as those of another buffer, keeping their game indexes."""
+        self._write(rows)
+        if len(rows):
+            self.num_games = max(self.num_games, int(rows["game"].max()) + 1)
+
+    @classmethod
+    def load(cls, path: Path, capacity: Optional[int] = None) -> ReplayBuffer:
+        """Load recorded moves from a `.npy` file.
+
+        Args:
+            path: The file written by `save`.
+            capacity: Capacity of the loaded buffer (default: the number of stored moves).
+
+        Returns:
+            A ReplayBuffer holding the stored moves.
+        """
+        rows = np.load(path)
+        board_size = int(round(rows.dtype["state"].itemsize ** 0.5))
+        buffer = cls(board_size, capacity or max(len(rows), 1))
+        buffer.add_transitions(rows)
+        return buffer
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _write(self, rows: np.ndarray) -> None:
+        """Write rows into the ring, overwriting the oldest moves once full."""
+        rows = rows[-self.capacity :]
+        first = min(len(rows), self.capacity - self._next)
+        self._data[self._next : self._next + first] = rows[:first]
+        self._data[: len(rows) - first] = rows[first:]
+        self._next = (self._next + len(rows)) % self.capacity
+        self._size = min(self._size + len(rows), self.capacity)
+
+
+class TrajectoryRecorder(GameSubscriber):
+    """Records the trajectory of every game it is notified about into a ReplayBuffer.
+
+    Attributes:
+        buffer: The buffer the trajectories are written to.
+    """
+
+    def __init__(self, buffer: ReplayBuffer) -> None:
+        """Initialize a TrajectoryRecorder object."""
+        self.buffer = buffer
+        self._previous_board: Optional[np.ndarray] = None
+        self._states: list[str] = []
+        self._actions: list[int] = []
+        self._players: list[GameSymbol] = []
+
+    def notify(self, game: TicTacToe) -> None:
+        """Records the move that led to the current game state."""
+        board = game.board.flatten()
+        if self._previous_board is None:
+            self._previous_board = np.full(board.shape, GameSymbol.NONE)
+
+        action = int(np.flatnonzero(board != self._previous_board)[0])
+        self._states.append("".join(str(cell) for cell in self._previous_board))
+        self._actions.append(action)
+        self._players.append(board[action])
+        self._previous_board = board
+
+        if game.state == GameStatus.GAME_OVER:
+            self.buffer.add_game(self._states, self._actions, self._players, game.result.value)
+            self._previous_board = None
+            self._states, self._actions, self._players = [], [], []
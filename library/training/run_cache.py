@@ -0,0 +1,141 @@
+"""Run cache module."""
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+STATE_FILE = "state.pkl"
+# Part of every run key. Bump it whenever a code change alters the pickled state or the outcome of a run, so entries
+# cached by older code are never resumed from.
+CACHE_VERSION = 1
+ARTIFACTS_DIRECTORY = "artifacts"
+
+
+class RunCache:
+    """Content-addressed cache of the state and plot artifacts of completed runs.
+
+    A run is identified by a hash of everything that determines its outcome except the number of games, so a run of
+    1000 games and a run of 3000 games with the same configuration and seed share a key. The state of every completed
+    run, typically the trained agents and statistics trackers, is pickled under its key and game count:
+
+        <directory>/<key>/<games>/state.pkl
+        <directory>/<key>/<games>/artifacts/
+
+    A run can then be resumed from the longest cached run with the same key and at most as many games, and only has
+    to play the remaining games. Once the cache exceeds its size limit, the least recently used entries are evicted.
+
+    Attributes:
+        directory: The directory the cache is stored in.
+        max_bytes: Size limit of the cache.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = 2**30) -> None:
+        """Initialize a RunCache in the given directory."""
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def run_key(config: dict[str, Any]) -> str:
+        """Returns the key of a run from a JSON-serializable dictionary of its configuration and seed."""
+        payload = {"cache_version": CACHE_VERSION, "config": config}
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+    def cached_games(self, key: str) -> list[int]:
+        """Returns the game counts cached for a run key, in ascending order."""
+        run_directory = self.directory / key
+        if not run_directory.is_dir():
+            return []
+        return sorted(int(entry.name) for entry in run_directory.iterdir() if (entry / STATE_FILE).is_file())
+
+    def load(self, key: str, num_games: int) -> Optional[tuple[int, Any]]:
+        """Load the longest cached run with the given key and at most the given number of games.
+
+        Returns:
+            The game count and state of the cached run, or None if there is none.
+        """
+        candidates = [games for games in self.cached_games(key) if games <= num_games]
+        if not candidates:
+            return None
+
+        games = candidates[-1]
+        state_path = self.entry_directory(key, games) / STATE_FILE
+        with open(state_path, "rb") as file:
+            state = pickle.load(file)
+        # The modification time of the state file marks when the entry was last used
+        os.utime(state_path)
+        return games, state
+
+    def store(self, key: str, num_games: int, state: Any) -> Path:
+        """Cache the state of a completed run and evict old entries if the cache has grown too large.
+
+        Returns:
+            The directory of the new entry.
+        """
+        entry_directory = self.entry_directory(key, num_games)
+        entry_directory.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file of this run's own and replace atomically, so neither an interrupted run nor runs
+        # storing the same entry at the same time ever leave a truncated state behind
+        with tempfile.NamedTemporaryFile(dir=entry_directory, prefix=f"{STATE_FILE}.", suffix=".tmp", delete=False) as file:
+            temporary_path = Path(file.name)
+            try:
+                pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+            except BaseException:
+                temporary_path.unlink()
+                raise
+        temporary_path.replace(entry_directory / STATE_FILE)
+
+        self.evict(keep=entry_directory)
+        return entry_directory
+
+    def entry_directory(self, key: str, num_games: int) -> Path:
+        """Returns the directory of the cache entry for a run key and game count."""
+        return self.directory / key / str(num_games)
+
+    def artifacts_directory(self, key: str, num_games: int) -> Path:
+        """Returns the directory the plot artifacts of a cached run are stored in."""
+        return self.entry_directory(key, num_games) / ARTIFACTS_DIRECTORY
+
+    def size(self) -> int:
+        """Returns the total size of all cache entries in bytes."""
+        return sum(size for _, _, size in self._entries())
+
+    def evict(self, keep: Optional[Path] = None) -> int:
+        """Evict least recently used entries until the cache fits its size limit.
+
+        Args:
+            keep: An entry directory that is never evicted, such as the entry just stored.
+
+        Returns:
+            The number of evicted entries.
+        """
+        entries = sorted(self._entries())
+        total_size = sum(size for _, _, size in entries)
+        evicted = 0
+        for _, entry_directory, size in entries:
+            if total_size <= self.max_bytes:
+                break
+            if entry_directory == keep:
+                continue
+
+            shutil.rmtree(entry_directory, ignore_errors=True)
+            total_size -= size
+            evicted += 1
+            if not any(entry_directory.parent.iterdir()):
+                entry_directory.parent.rmdir()
+        return evicted
+
+    def _entries(self) -> list[tuple[float, Path, int]]:
+        """Returns the last use time, directory and size in bytes of every cache entry."""
+        if not self.directory.is_dir():
+            return []
+
+        entries = []
+        for state_path in self.directory.glob(f"*/*/{STATE_FILE}"):
+            entry_directory = state_path.parent
+            size = sum(path.stat().st_size for path in entry_directory.rglob("*") if path.is_file())
+            entries.append((state_path.stat().st_mtime, entry_directory, size))
+        return entries
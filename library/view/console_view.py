@@ -6,8 +6,8 @@ from library.view import View
 class ConsoleView(View):
     """Displays the game state to the console."""
 
-    def __init__(self) -> None:
-        self._board_lines = 4
+    def __init__(self, board_size: int = 3) -> None:
+        self._board_lines = board_size + 1
         self._history = []
         self.reset()
 
@@ -19,7 +19,7 @@ class ConsoleView(View):
         for row_index in range(game.rows):
             row_string = ""
             for game_board in self._history:
-                row_string += f"{game_board[row_index][0]} | {game_board[row_index][1]} | {game_board[row_index][2]}\t"
+                row_string += " | ".join(str(cell) for cell in game_board[row_index]) + "\t"
             board_string += row_string + "\n"
 
         print("\033[F" * self._board_lines)
@@ -1,60 +1,204 @@
 """Main module for Tic Tac Brainiac."""
 import argparse
+import multiprocessing
+import shutil
 from pathlib import Path
 
-from library.agent import Agent, HumanAgent, MatchboxAgent, RandomAgent
-from library.controller import GameController, GamePublisher
+from library.agent import Agent, EvictionPolicy, HumanAgent, MatchboxAgent, RandomAgent, RandomStream
+from library.controller import GameController, GamePublisher, tap
 from library.model import GameSymbol, TicTacToe
-from library.statistics import BatchWinTracker, GameLengthTracker, RollingWinRateTracker, WinRateTracker, WinStreakTracker, WinTracker
+from library.statistics import (
+    BatchWinTracker,
+    GameLengthDistributionTracker,
+    GameLengthTracker,
+    LiveDashboard,
+    MoveLatencyTracker,
+    MoveQualityTracker,
+    RollingWinRateTracker,
+    StreakDistributionTracker,
+    WinRateTracker,
+    WinStreakTracker,
+    WinTracker,
+    export_plots,
+)
+from library.training import (
+    ConvergenceStoppingPolicy,
+    MergeStrategy,
+    ParallelTrainer,
+    ReplayBuffer,
+    RunCache,
+    TrajectoryRecorder,
+)
 from library.view import ConsoleView
 
+# Arguments that only change how a run is shown or stored, not its outcome
+NON_RUN_ARGUMENTS = {"games", "live_dashboard", "headless", "cache_dir", "cache_size"}
+
 
 def main():
     """Run the main program."""
     args = parse_args()
 
-    game = TicTacToe.from_board_size(3)
+    cache = None
+    if args.cache_dir is not None:
+        cache = RunCache(args.cache_dir, args.cache_size * 2**20)
+    run_key = RunCache.run_key(run_config(args))
+
+    cached = cache.load(run_key, args.games) if cache is not None else None
+    if cached is not None:
+        run = cached[1]
+        print(f"Resuming from a cached run of {run['games_played']} games")
+    else:
+        run = create_run(args)
+    statistics_tracker = run["trackers"]
+    stopping_policy = run["stopping_policy"]
+
+    game = TicTacToe.from_board_size(args.board_size)
 
     game_publisher = GamePublisher()
-    game_publisher.add_subscriber(ConsoleView())
+    game_publisher.add_subscriber(ConsoleView(args.board_size))
+    for tracker in statistics_tracker:
+        game_publisher.add_subscriber(tracker)
+
+    dashboard = None
+    if args.live_dashboard:
+        dashboard = LiveDashboard(statistics_tracker, recent_points=args.retention or 1000)
+        game_publisher.add_subscriber(dashboard)
+        dashboard.start()
+
+    if run["replay_buffer"] is not None:
+        game_publisher.add_subscriber(TrajectoryRecorder(run["replay_buffer"]))
 
+    remaining_games = 0 if run["stopped"] else args.games - run["games_played"]
+    if remaining_games > 0:
+        game_controller = GameController(game, run["players"], game_publisher, stopping_policy)
+        records = tap(game_controller.stream_games(remaining_games), run["latency_tracker"].add_record)
+        games_played = sum(1 for _ in records)
+        run["games_played"] += games_played
+        run["stopped"] = games_played < remaining_games
+        if cache is not None:
+            cache.store(run_key, run["games_played"], run)
+    if dashboard is not None:
+        dashboard.close()
+    if run["stopped"]:
+        print(f"Stopped after {run['games_played']} games, saving {args.games - run['games_played']} games: {stopping_policy.stop_reason}")
+
+    if run["replay_buffer"] is not None:
+        run["replay_buffer"].save(args.record_trajectories)
+
+    if args.headless:
+        if cache is None:
+            export_plots(statistics_tracker, Path("artifacts"))
+        else:
+            # Plots of a cached run are rendered once and copied from then on
+            cached_artifacts = cache.artifacts_directory(run_key, run["games_played"])
+            if not cached_artifacts.is_dir():
+                export_plots(statistics_tracker, cached_artifacts)
+            shutil.copytree(cached_artifacts, Path("artifacts"), dirs_exist_ok=True)
+    else:
+        for tracker in statistics_tracker:
+            tracker.plot_statistics(display=True, directory=Path("artifacts"))
+
+
+def create_run(args) -> dict:
+    """Returns the state of a new run: its players, trackers and stopping policy, before any game is played."""
+    rolling_winrate_tracker = RollingWinRateTracker(window_size=250, retention=args.retention)
+    game_length_tracker = GameLengthTracker(window_size=250, retention=args.retention)
+    latency_tracker = MoveLatencyTracker()
     statistics_tracker = [
         WinTracker(),
-        WinRateTracker(),
-        BatchWinTracker(batch_size=250),
-        RollingWinRateTracker(window_size=250),
-        GameLengthTracker(window_size=250),
+        WinRateTracker(retention=args.retention),
+        BatchWinTracker(batch_size=250, retention=args.retention),
+        rolling_winrate_tracker,
+        game_length_tracker,
+        GameLengthDistributionTracker(),
         WinStreakTracker(),
+        StreakDistributionTracker(),
+        latency_tracker,
     ]
-    for tracker in statistics_tracker:
-        game_publisher.add_subscriber(tracker)
+    if args.board_size == 3:
+        statistics_tracker.append(MoveQualityTracker(window_size=250))
+
+    replay_buffer = None
+    if args.record_trajectories:
+        replay_buffer = ReplayBuffer(args.board_size)
+
+    stopping_policy = None
+    if args.stop_tolerance is not None or args.target_rate is not None:
+        stopping_policy = ConvergenceStoppingPolicy(
+            rolling_winrate_tracker,
+            tolerance=args.stop_tolerance,
+            horizon=args.stop_horizon,
+            target_rate=args.target_rate,
+            length_tracker=game_length_tracker,
+        )
 
     players = create_players(args)
-    game_controller = GameController(game, players, game_publisher)
-    game_controller.play_games(args.games)
+    if args.pretrain_games > 0:
+        trainer = ParallelTrainer(args.workers, merge_strategy=MergeStrategy(args.merge_strategy))
+        for player in players.values():
+            if isinstance(player, MatchboxAgent):
+                trainer.train(player, args.pretrain_games)
 
-    for tracker in statistics_tracker:
-        tracker.plot_statistics(display=True, directory=Path("artifacts"))
+    return {
+        "players": players,
+        "trackers": statistics_tracker,
+        "latency_tracker": latency_tracker,
+        "stopping_policy": stopping_policy,
+        "replay_buffer": replay_buffer,
+        "games_played": 0,
+        "stopped": False,
+    }
+
+
+def run_config(args) -> dict:
+    """Returns everything that determines the outcome of a run except the number of games."""
+    config = {name: value for name, value in vars(args).items() if name not in NON_RUN_ARGUMENTS}
+    config["record_trajectories"] = args.record_trajectories is not None
+    config["workers"] = args.workers or multiprocessing.cpu_count()
+    return config
 
 
 def create_players(args) -> dict[GameSymbol, Agent]:
     """Returns the players for the game."""
+    x_stream, o_stream = RandomStream(args.seed).spawn(2)
+
+    if args.self_play:
+        return MatchboxAgent.self_play_pair(
+            args.board_size,
+            max_boxes=args.max_boxes,
+            eviction_policy=EvictionPolicy(args.eviction_policy),
+            random_stream=x_stream,
+        )
+
     players = {}
     if args.player1 == "human":
         players[GameSymbol.X] = HumanAgent(GameSymbol.X)
     elif args.player1 == "random":
-        players[GameSymbol.X] = RandomAgent(GameSymbol.X)
+        players[GameSymbol.X] = RandomAgent(GameSymbol.X, x_stream)
     elif args.player1 == "ai":
-        players[GameSymbol.X] = MatchboxAgent.from_board_size(GameSymbol.X, args.board_size)
+        players[GameSymbol.X] = MatchboxAgent.from_board_size(
+            GameSymbol.X,
+            args.board_size,
+            max_boxes=args.max_boxes,
+            eviction_policy=EvictionPolicy(args.eviction_policy),
+            random_stream=x_stream,
+        )
     else:
         raise ValueError(f"Invalid player type: {args.player1}")
 
     if args.player2 == "human":
         players[GameSymbol.O] = HumanAgent(GameSymbol.O)
     elif args.player2 == "random":
-        players[GameSymbol.O] = RandomAgent(GameSymbol.O)
+        players[GameSymbol.O] = RandomAgent(GameSymbol.O, o_stream)
     elif args.player2 == "ai":
-        players[GameSymbol.O] = MatchboxAgent.from_board_size(GameSymbol.O, args.board_size)
+        players[GameSymbol.O] = MatchboxAgent.from_board_size(
+            GameSymbol.O,
+            args.board_size,
+            max_boxes=args.max_boxes,
+            eviction_policy=EvictionPolicy(args.eviction_policy),
+            random_stream=o_stream,
+        )
     else:
         raise ValueError(f"Invalid player type: {args.player2}")
 
@@ -83,7 +227,105 @@ def parse_args():
         default=3,
         help="Size of the game board",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--self-play",
+        action="store_true",
+        help="Let two ai players share one matchbox engine, storing each position once from the side to move and up to symmetry",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed for the agents' random numbers, for reproducible runs",
+    )
+    parser.add_argument(
+        "--stop-tolerance",
+        type=float,
+        default=None,
+        help="Stop once the rolling rates stay within this tolerance over the stop horizon",
+    )
+    parser.add_argument(
+        "--stop-horizon",
+        type=int,
+        default=500,
+        help="Number of games the rolling rates must stay within the stop tolerance",
+    )
+    parser.add_argument(
+        "--target-rate",
+        type=float,
+        default=None,
+        help="Stop once player 2's rolling win rate reaches this rate",
+    )
+    parser.add_argument(
+        "--record-trajectories",
+        type=Path,
+        default=None,
+        help="Save every game's moves to this .npy replay buffer file",
+    )
+    parser.add_argument(
+        "--max-boxes",
+        type=int,
+        default=None,
+        help="Maximum number of matchboxes kept by each ai agent",
+    )
+    parser.add_argument(
+        "--eviction-policy",
+        choices=[policy.value for policy in EvictionPolicy],
+        default=EvictionPolicy.LRU.value,
+        help="How ai agents choose matchboxes to evict once --max-boxes is reached",
+    )
+    parser.add_argument(
+        "--pretrain-games",
+        type=int,
+        default=0,
+        help="Number of games each ai player trains on in parallel worker processes before the games are played",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes used for pretraining, each needing its own CPU to speed it up (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--merge-strategy",
+        choices=[strategy.value for strategy in MergeStrategy],
+        default=MergeStrategy.SUM.value,
+        help="How the bead changes of the pretraining workers are merged",
+    )
+    parser.add_argument(
+        "--retention",
+        type=int,
+        default=None,
+        help="Number of recent games the statistics keep at full resolution, downsampling older games (default: all)",
+    )
+    parser.add_argument(
+        "--live-dashboard",
+        action="store_true",
+        help="Show the statistics live while the games are played",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Render all statistics plots in parallel to PNG and SVG files without displaying them",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Cache seeded runs and their plots here, and resume repeated runs from the longest cached run",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=1024,
+        help="Size limit of the run cache in MB, beyond which the least recently used runs are evicted",
+    )
+    args = parser.parse_args()
+    if args.cache_dir is not None and (args.seed is None or "human" in (args.player1, args.player2)):
+        parser.error("--cache-dir requires a --seed and no human players, so runs can be reproduced")
+    if args.self_play and (args.player1, args.player2) != ("ai", "ai"):
+        parser.error("--self-play requires both players to be ai")
+    return args
 
 
 if __name__ == "__main__":